@@ -196,7 +196,9 @@ class HomeworksLEDBinarySensor(
         await super().async_added_to_hass()
 
         # Request initial state
-        await self.coordinator.async_request_keypad_led_states(self._keypad_addr)
+        await self.coordinator.async_request_initial_keypad_led_states(
+            self._keypad_addr
+        )
 
 
 class HomeworksCCIBinarySensor(
@@ -102,6 +102,16 @@ class HomeworksClient:
         # Track connection state for callbacks
         self._was_connected = False
 
+        # Message handlers keyed by exact message class
+        self._handlers: dict[type[AnyMessage], Callable[[Any], None]] = {
+            KLSMessage: self._handle_kls_message,
+            DimmerLevelMessage: self._handle_dimmer_message,
+            ButtonEventMessage: self._handle_button_message,
+            KeypadEnableMessage: self._handle_keypad_enable_message,
+            GrafikEyeSceneMessage: self._handle_grafik_eye_message,
+            SivoiaSceneMessage: self._handle_sivoia_message,
+        }
+
     @property
     def connected(self) -> bool:
         """Return True if connected to the controller."""
@@ -178,25 +188,19 @@ class HomeworksClient:
                 self._message_callback(HW_CONNECTION_LOST, [])
 
         # Route by message type
-        if isinstance(msg, KLSMessage):
-            self._handle_kls_message(msg)
-        elif isinstance(msg, DimmerLevelMessage):
-            self._handle_dimmer_message(msg)
-        elif isinstance(msg, ButtonEventMessage):
-            self._handle_button_message(msg)
-        elif isinstance(msg, KeypadEnableMessage):
-            self._handle_keypad_enable_message(msg)
-        elif isinstance(msg, GrafikEyeSceneMessage):
-            self._handle_grafik_eye_message(msg)
-        elif isinstance(msg, SivoiaSceneMessage):
-            self._handle_sivoia_message(msg)
+        handler = self._handlers.get(type(msg))
+        if handler:
+            handler(msg)
 
     def _handle_kls_message(self, msg: KLSMessage) -> None:
         """Handle KLS (Keypad LED State) message."""
+        # One list per message, shared by the cache and the coordinator
+        led_states = list(msg.led_states)
+
         # Store in cache
         kls_state = KLSState(
             address=msg.address,
-            led_states=list(msg.led_states),
+            led_states=led_states,
             timestamp=msg.timestamp,
         )
         self._kls_cache[msg.address] = kls_state
@@ -206,9 +210,7 @@ class HomeworksClient:
 
         # Notify callback
         if self._message_callback:
-            self._message_callback(
-                HW_KEYPAD_LED_CHANGED, [msg.address, list(msg.led_states)]
-            )
+            self._message_callback(HW_KEYPAD_LED_CHANGED, [msg.address, led_states])
 
     def _handle_dimmer_message(self, msg: DimmerLevelMessage) -> None:
         """Handle DL (Dimmer Level) message."""
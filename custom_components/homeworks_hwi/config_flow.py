@@ -74,6 +74,7 @@ from .const import (
     CCO_TYPE_LIGHT,
     CCO_TYPE_LOCK,
     CCO_TYPE_SWITCH,
+    CCO_TYPES,
     DEFAULT_BUTTON_NAME,
     DEFAULT_CCI_NAME,
     DEFAULT_CCO_NAME,
@@ -160,6 +161,30 @@ def _validate_cco_address(addr_str: str, button: int) -> CCOAddress:
         raise SchemaFlowError("invalid_addr") from err
 
 
+def _bulk_delete(
+    items: list[dict[str, Any]], indices: set[int]
+) -> list[dict[str, Any]]:
+    """Return items without the given positions, in a single pass."""
+    return [item for i, item in enumerate(items) if i not in indices]
+
+
+def _remove_address_entities(
+    handler: SchemaCommonFlowHandler,
+    items: list[dict[str, Any]],
+    indices: set[int],
+) -> None:
+    """Remove registry entities belonging to the items at the given positions."""
+    addrs = {item[CONF_ADDR] for i, item in enumerate(items) if i in indices}
+    if not addrs:
+        return
+    registry = er.async_get(handler.parent_handler.hass)
+    for entity_id in list(registry.entities):
+        entity = registry.entities[entity_id]
+        unique_id = entity.unique_id or ""
+        if entity.platform == DOMAIN and any(addr in unique_id for addr in addrs):
+            registry.async_remove(entity_id)
+
+
 # === CCO Device CRUD ===
 
 
@@ -291,21 +316,11 @@ async def validate_remove_cco_device(
     handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
 ) -> dict[str, Any]:
     """Remove selected CCO devices."""
-    removed = set(user_input[CONF_INDEX])
-    registry = er.async_get(handler.parent_handler.hass)
-
-    new_devices = []
-    for i, device in enumerate(handler.options.get(CONF_CCO_DEVICES, [])):
-        if str(i) not in removed:
-            new_devices.append(device)
-        else:
-            addr = device[CONF_ADDR]
-            for entity_id in list(registry.entities):
-                entity = registry.entities[entity_id]
-                if entity.platform == DOMAIN and addr in (entity.unique_id or ""):
-                    registry.async_remove(entity_id)
+    indices = {int(i) for i in user_input[CONF_INDEX]}
+    items = handler.options.get(CONF_CCO_DEVICES, [])
 
-    handler.options[CONF_CCO_DEVICES] = new_devices
+    _remove_address_entities(handler, items, indices)
+    handler.options[CONF_CCO_DEVICES] = _bulk_delete(items, indices)
     return {}
 
 
@@ -318,9 +333,11 @@ async def validate_add_light(
     """Validate light input."""
     user_input[CONF_ADDR] = _validate_address(user_input[CONF_ADDR])
 
-    for item in handler.options.get(CONF_DIMMERS, []):
-        if normalize_address(item[CONF_ADDR]) == user_input[CONF_ADDR]:
-            raise SchemaFlowError("duplicated_addr")
+    if any(
+        normalize_address(item[CONF_ADDR]) == user_input[CONF_ADDR]
+        for item in handler.options.get(CONF_DIMMERS, [])
+    ):
+        raise SchemaFlowError("duplicated_addr")
 
     items = handler.options.setdefault(CONF_DIMMERS, [])
     items.append(user_input)
@@ -392,22 +409,11 @@ async def validate_remove_light(
     handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
 ) -> dict[str, Any]:
     """Remove selected lights."""
-    removed = set(user_input[CONF_INDEX])
-    registry = er.async_get(handler.parent_handler.hass)
+    indices = {int(i) for i in user_input[CONF_INDEX]}
+    items = handler.options.get(CONF_DIMMERS, [])
 
-    new_items = []
-    for i, item in enumerate(handler.options.get(CONF_DIMMERS, [])):
-        if str(i) not in removed:
-            new_items.append(item)
-        else:
-            for entity_id in list(registry.entities):
-                entity = registry.entities[entity_id]
-                if entity.platform == DOMAIN and item[CONF_ADDR] in (
-                    entity.unique_id or ""
-                ):
-                    registry.async_remove(entity_id)
-
-    handler.options[CONF_DIMMERS] = new_items
+    _remove_address_entities(handler, items, indices)
+    handler.options[CONF_DIMMERS] = _bulk_delete(items, indices)
     return {}
 
 
@@ -420,9 +426,11 @@ async def validate_add_rpm_cover(
     """Validate RPM cover input."""
     user_input[CONF_ADDR] = _validate_address(user_input[CONF_ADDR])
 
-    for item in handler.options.get(CONF_RPM_COVERS, []):
-        if normalize_address(item[CONF_ADDR]) == user_input[CONF_ADDR]:
-            raise SchemaFlowError("duplicated_addr")
+    if any(
+        normalize_address(item[CONF_ADDR]) == user_input[CONF_ADDR]
+        for item in handler.options.get(CONF_RPM_COVERS, [])
+    ):
+        raise SchemaFlowError("duplicated_addr")
 
     items = handler.options.setdefault(CONF_RPM_COVERS, [])
     items.append(user_input)
@@ -494,22 +502,11 @@ async def validate_remove_rpm_cover(
     handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
 ) -> dict[str, Any]:
     """Remove selected RPM covers."""
-    removed = set(user_input[CONF_INDEX])
-    registry = er.async_get(handler.parent_handler.hass)
+    indices = {int(i) for i in user_input[CONF_INDEX]}
+    items = handler.options.get(CONF_RPM_COVERS, [])
 
-    new_items = []
-    for i, item in enumerate(handler.options.get(CONF_RPM_COVERS, [])):
-        if str(i) not in removed:
-            new_items.append(item)
-        else:
-            for entity_id in list(registry.entities):
-                entity = registry.entities[entity_id]
-                if entity.platform == DOMAIN and item[CONF_ADDR] in (
-                    entity.unique_id or ""
-                ):
-                    registry.async_remove(entity_id)
-
-    handler.options[CONF_RPM_COVERS] = new_items
+    _remove_address_entities(handler, items, indices)
+    handler.options[CONF_RPM_COVERS] = _bulk_delete(items, indices)
     return {}
 
 
@@ -522,9 +519,11 @@ async def validate_add_keypad(
     """Validate keypad input."""
     user_input[CONF_ADDR] = _validate_address(user_input[CONF_ADDR])
 
-    for item in handler.options.get(CONF_KEYPADS, []):
-        if normalize_address(item[CONF_ADDR]) == user_input[CONF_ADDR]:
-            raise SchemaFlowError("duplicated_addr")
+    if any(
+        normalize_address(item[CONF_ADDR]) == user_input[CONF_ADDR]
+        for item in handler.options.get(CONF_KEYPADS, [])
+    ):
+        raise SchemaFlowError("duplicated_addr")
 
     items = handler.options.setdefault(CONF_KEYPADS, [])
     items.append(user_input | {CONF_BUTTONS: []})
@@ -579,22 +578,11 @@ async def validate_remove_keypad(
     handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
 ) -> dict[str, Any]:
     """Remove selected keypads."""
-    removed = set(user_input[CONF_INDEX])
-    registry = er.async_get(handler.parent_handler.hass)
+    indices = {int(i) for i in user_input[CONF_INDEX]}
+    items = handler.options.get(CONF_KEYPADS, [])
 
-    new_items = []
-    for i, item in enumerate(handler.options.get(CONF_KEYPADS, [])):
-        if str(i) not in removed:
-            new_items.append(item)
-        else:
-            for entity_id in list(registry.entities):
-                entity = registry.entities[entity_id]
-                if entity.platform == DOMAIN and item[CONF_ADDR] in (
-                    entity.unique_id or ""
-                ):
-                    registry.async_remove(entity_id)
-
-    handler.options[CONF_KEYPADS] = new_items
+    _remove_address_entities(handler, items, indices)
+    handler.options[CONF_KEYPADS] = _bulk_delete(items, indices)
     return {}
 
 
@@ -690,15 +678,10 @@ async def validate_remove_button(
     handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
 ) -> dict[str, Any]:
     """Remove selected buttons."""
-    removed = set(user_input[CONF_INDEX])
-    keypad_idx = handler.flow_state["_idx"]
-
-    new_buttons = []
-    for i, button in enumerate(handler.options[CONF_KEYPADS][keypad_idx][CONF_BUTTONS]):
-        if str(i) not in removed:
-            new_buttons.append(button)
+    indices = {int(i) for i in user_input[CONF_INDEX]}
+    keypad = handler.options[CONF_KEYPADS][handler.flow_state["_idx"]]
 
-    handler.options[CONF_KEYPADS][keypad_idx][CONF_BUTTONS] = new_buttons
+    keypad[CONF_BUTTONS] = _bulk_delete(keypad[CONF_BUTTONS], indices)
     return {}
 
 
@@ -743,6 +726,22 @@ class DeviceImport(NamedTuple):
     device_class: str | None = None  # For CCI: door/window/motion/etc.
 
 
+# CSV device_type values that import as a CCO with a fixed entity type
+_CSV_CCO_TYPES = {
+    "COVER": CCO_TYPE_COVER,
+    "LOCK": CCO_TYPE_LOCK,
+    "CLIMATE": CCO_TYPE_CLIMATE,
+    "FAN": CCO_TYPE_FAN,
+}
+
+
+def _row_button(row: dict[str, str]) -> int:
+    """Return a CSV row's relay/button number, defaulting to 1."""
+    if relay := row.get("relay"):
+        return int(relay)
+    return int(row.get("button") or 1)
+
+
 async def async_parse_csv(
     handler: SchemaCommonFlowHandler, user_input: dict[str, Any]
 ) -> dict[str, Any]:
@@ -782,12 +781,9 @@ async def async_parse_csv(
             )
 
             if device_type in ("CCO", "SWITCH"):
-                button = int(row.get("relay", row.get("button", 1)))
+                button = _row_button(row)
                 # Map type column to entity type, default to switch
-                entity_type = cco_type if cco_type in (
-                    CCO_TYPE_SWITCH, CCO_TYPE_LIGHT, CCO_TYPE_COVER,
-                    CCO_TYPE_LOCK, CCO_TYPE_CLIMATE, CCO_TYPE_FAN
-                ) else CCO_TYPE_SWITCH
+                entity_type = cco_type if cco_type in CCO_TYPES else CCO_TYPE_SWITCH
                 devices.append(
                     DeviceImport(
                         "CCO",
@@ -809,51 +805,14 @@ async def async_parse_csv(
                         area,
                     )
                 )
-            elif device_type == "COVER":
-                button = int(row.get("relay", row.get("button", 1)))
-                devices.append(
-                    DeviceImport(
-                        "CCO",
-                        normalize_address(row["address"].strip()),
-                        button,
-                        row.get("name", "").strip(),
-                        CCO_TYPE_COVER,
-                        area,
-                    )
-                )
-            elif device_type == "LOCK":
-                button = int(row.get("relay", row.get("button", 1)))
+            elif (csv_cco_type := _CSV_CCO_TYPES.get(device_type)) is not None:
                 devices.append(
                     DeviceImport(
                         "CCO",
                         normalize_address(row["address"].strip()),
-                        button,
-                        row.get("name", "").strip(),
-                        CCO_TYPE_LOCK,
-                        area,
-                    )
-                )
-            elif device_type == "CLIMATE":
-                button = int(row.get("relay", row.get("button", 1)))
-                devices.append(
-                    DeviceImport(
-                        "CCO",
-                        normalize_address(row["address"].strip()),
-                        button,
-                        row.get("name", "").strip(),
-                        CCO_TYPE_CLIMATE,
-                        area,
-                    )
-                )
-            elif device_type == "FAN":
-                button = int(row.get("relay", row.get("button", 1)))
-                devices.append(
-                    DeviceImport(
-                        "CCO",
-                        normalize_address(row["address"].strip()),
-                        button,
+                        _row_button(row),
                         row.get("name", "").strip(),
-                        CCO_TYPE_FAN,
+                        csv_cco_type,
                         area,
                     )
                 )
@@ -895,70 +854,44 @@ async def async_parse_csv(
     return {}
 
 
-def _is_duplicate_cco(handler: SchemaCommonFlowHandler, address: str, button: int) -> bool:
-    """Check if a CCO device already exists."""
-    return _find_existing_cco(handler, address, button) is not None
-
-
-def _find_existing_cco(handler: SchemaCommonFlowHandler, address: str, button: int) -> int | None:
-    """Find existing CCO device index, or None if not found."""
+def _cco_key(address: str, button: int) -> tuple[int, int, int, int] | None:
+    """Return the unique key of a CCO address, or None if it is invalid."""
     try:
-        new_addr = _validate_cco_address(address, button)
-        for i, device in enumerate(handler.options.get(CONF_CCO_DEVICES, [])):
-            existing_addr = _validate_cco_address(
-                device[CONF_ADDR],
-                device.get(CONF_BUTTON_NUMBER, device.get(CONF_RELAY_NUMBER, 1)),
-            )
-            if existing_addr.unique_key == new_addr.unique_key:
-                return i
-    except Exception:
-        pass
-    return None
-
-
-def _is_duplicate_dimmer(handler: SchemaCommonFlowHandler, address: str) -> bool:
-    """Check if a dimmer already exists."""
-    return _find_existing_dimmer(handler, address) is not None
-
-
-def _find_existing_dimmer(handler: SchemaCommonFlowHandler, address: str) -> int | None:
-    """Find existing dimmer index, or None if not found."""
-    normalized = normalize_address(address)
-    for i, dimmer in enumerate(handler.options.get(CONF_DIMMERS, [])):
-        if normalize_address(dimmer[CONF_ADDR]) == normalized:
-            return i
-    return None
-
-
-def _is_duplicate_cci(handler: SchemaCommonFlowHandler, address: str, input_number: int) -> bool:
-    """Check if a CCI device already exists."""
-    return _find_existing_cci(handler, address, input_number) is not None
+        return _validate_cco_address(address, button).unique_key
+    except SchemaFlowError:
+        return None
 
 
-def _find_existing_cci(handler: SchemaCommonFlowHandler, address: str, input_number: int) -> int | None:
-    """Find existing CCI device index, or None if not found."""
-    normalized = normalize_address(address)
-    for i, device in enumerate(handler.options.get(CONF_CCI_DEVICES, [])):
-        if (
-            normalize_address(device[CONF_ADDR]) == normalized
-            and device.get(CONF_INPUT_NUMBER, 1) == input_number
-        ):
-            return i
-    return None
+def _build_cco_index(
+    devices: list[dict[str, Any]],
+) -> dict[tuple[int, int, int, int], int]:
+    """Map each CCO device's unique key to its first index in the list."""
+    index: dict[tuple[int, int, int, int], int] = {}
+    for i, device in enumerate(devices):
+        key = _cco_key(
+            device[CONF_ADDR],
+            device.get(CONF_BUTTON_NUMBER, device.get(CONF_RELAY_NUMBER, 1)),
+        )
+        if key is not None:
+            index.setdefault(key, i)
+    return index
 
 
-def _is_duplicate_rpm_cover(handler: SchemaCommonFlowHandler, address: str) -> bool:
-    """Check if an RPM cover already exists."""
-    return _find_existing_rpm_cover(handler, address) is not None
+def _build_address_index(items: list[dict[str, Any]]) -> dict[str, int]:
+    """Map each item's normalized address to its first index in the list."""
+    index: dict[str, int] = {}
+    for i, item in enumerate(items):
+        index.setdefault(normalize_address(item[CONF_ADDR]), i)
+    return index
 
 
-def _find_existing_rpm_cover(handler: SchemaCommonFlowHandler, address: str) -> int | None:
-    """Find existing RPM cover index, or None if not found."""
-    normalized = normalize_address(address)
-    for i, cover in enumerate(handler.options.get(CONF_RPM_COVERS, [])):
-        if normalize_address(cover[CONF_ADDR]) == normalized:
-            return i
-    return None
+def _build_cci_index(devices: list[dict[str, Any]]) -> dict[tuple[str, int], int]:
+    """Map each CCI device's (address, input) to its first index in the list."""
+    index: dict[tuple[str, int], int] = {}
+    for i, device in enumerate(devices):
+        key = (normalize_address(device[CONF_ADDR]), device.get(CONF_INPUT_NUMBER, 1))
+        index.setdefault(key, i)
+    return index
 
 
 async def get_confirm_import_schema(handler: SchemaCommonFlowHandler) -> vol.Schema:
@@ -967,9 +900,15 @@ async def get_confirm_import_schema(handler: SchemaCommonFlowHandler) -> vol.Sch
     selections = {}
     default_selected = []
 
+    # Index existing devices once instead of scanning them per CSV row
+    dimmer_index = _build_address_index(handler.options.get(CONF_DIMMERS, []))
+    cci_index = _build_cci_index(handler.options.get(CONF_CCI_DEVICES, []))
+    rpm_cover_index = _build_address_index(handler.options.get(CONF_RPM_COVERS, []))
+    cco_index = _build_cco_index(handler.options.get(CONF_CCO_DEVICES, []))
+
     for idx, dev in enumerate(devices):
         if dev.device_type == "DIMMER":
-            is_dup = _is_duplicate_dimmer(handler, dev.address)
+            is_dup = normalize_address(dev.address) in dimmer_index
             label = f"Dimmer: {dev.name} ({dev.address})"
             if is_dup:
                 label += " [ALREADY EXISTS]"
@@ -977,7 +916,7 @@ async def get_confirm_import_schema(handler: SchemaCommonFlowHandler) -> vol.Sch
                 default_selected.append(str(idx))
             selections[str(idx)] = label
         elif dev.device_type == "CCI":
-            is_dup = _is_duplicate_cci(handler, dev.address, dev.button or 1)
+            is_dup = (normalize_address(dev.address), dev.button or 1) in cci_index
             device_class = dev.device_class or "input"
             label = f"CCI ({device_class}): {dev.name} ({dev.address}:{dev.button})"
             if is_dup:
@@ -986,7 +925,7 @@ async def get_confirm_import_schema(handler: SchemaCommonFlowHandler) -> vol.Sch
                 default_selected.append(str(idx))
             selections[str(idx)] = label
         elif dev.device_type == "MOTOR_COVER":
-            is_dup = _is_duplicate_rpm_cover(handler, dev.address)
+            is_dup = normalize_address(dev.address) in rpm_cover_index
             label = f"Motor Cover: {dev.name} ({dev.address})"
             if is_dup:
                 label += " [ALREADY EXISTS]"
@@ -996,7 +935,7 @@ async def get_confirm_import_schema(handler: SchemaCommonFlowHandler) -> vol.Sch
         else:
             # CCO device
             entity_type = dev.entity_type or "switch"
-            is_dup = _is_duplicate_cco(handler, dev.address, dev.button or 1)
+            is_dup = _cco_key(dev.address, dev.button or 1) in cco_index
             label = f"CCO ({entity_type}): {dev.name} ({dev.address}:{dev.button})"
             if is_dup:
                 label += " [ALREADY EXISTS]"
@@ -1033,11 +972,18 @@ async def validate_confirm_import(
     selected = user_input.get("devices", [])
     skipped = 0
 
+    # Index existing devices once; new devices are added as they are imported
+    dimmer_index = _build_address_index(handler.options.get(CONF_DIMMERS, []))
+    cci_index = _build_cci_index(handler.options.get(CONF_CCI_DEVICES, []))
+    rpm_cover_index = _build_address_index(handler.options.get(CONF_RPM_COVERS, []))
+    cco_index = _build_cco_index(handler.options.get(CONF_CCO_DEVICES, []))
+
     for idx in selected:
         device = devices[int(idx)]
         if device.device_type == "DIMMER":
             # Check if duplicate - if so, update the area instead of skipping
-            existing_idx = _find_existing_dimmer(handler, device.address)
+            dimmer_key = normalize_address(device.address)
+            existing_idx = dimmer_index.get(dimmer_key)
             if existing_idx is not None:
                 # Update existing dimmer with new area if provided
                 if device.area:
@@ -1057,10 +1003,12 @@ async def validate_confirm_import(
             }
             if device.area:
                 dimmer_config[CONF_AREA] = device.area
+            dimmer_index[dimmer_key] = len(items)
             items.append(dimmer_config)
         elif device.device_type == "CCI":
             # Check if duplicate - if so, update the area instead of skipping
-            existing_idx = _find_existing_cci(handler, device.address, device.button or 1)
+            cci_key = (normalize_address(device.address), device.button or 1)
+            existing_idx = cci_index.get(cci_key)
             if existing_idx is not None:
                 # Update existing CCI with new area if provided
                 if device.area:
@@ -1087,10 +1035,12 @@ async def validate_confirm_import(
                 cci_config[CONF_DEVICE_CLASS] = device.device_class
             if device.area:
                 cci_config[CONF_AREA] = device.area
+            cci_index[cci_key] = len(items)
             items.append(cci_config)
         elif device.device_type == "MOTOR_COVER":
             # Check if duplicate - if so, update the area instead of skipping
-            existing_idx = _find_existing_rpm_cover(handler, device.address)
+            rpm_cover_key = normalize_address(device.address)
+            existing_idx = rpm_cover_index.get(rpm_cover_key)
             if existing_idx is not None:
                 # Update existing motor cover with new area if provided
                 if device.area:
@@ -1113,11 +1063,13 @@ async def validate_confirm_import(
             }
             if device.area:
                 rpm_config[CONF_AREA] = device.area
+            rpm_cover_index[rpm_cover_key] = len(items)
             items.append(rpm_config)
         else:
             # CCO device
             # Check if duplicate - if so, update the area instead of skipping
-            existing_idx = _find_existing_cco(handler, device.address, device.button or 1)
+            cco_key = _cco_key(device.address, device.button or 1)
+            existing_idx = cco_index.get(cco_key)
             if existing_idx is not None:
                 # Update existing device with new area if provided
                 if device.area:
@@ -1152,6 +1104,8 @@ async def validate_confirm_import(
                 _LOGGER.debug("Added area '%s' to CCO device %s", device.area, device.name)
             else:
                 _LOGGER.warning("No area found for CCO device %s", device.name)
+            if cco_key is not None:
+                cco_index[cco_key] = len(items)
             items.append(cco_config)
 
     # Debug: dump final CCO config to verify areas are stored
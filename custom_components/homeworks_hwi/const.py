@@ -76,6 +76,16 @@ CCO_TYPE_COVER: Final = "cover"
 CCO_TYPE_LOCK: Final = "lock"
 CCO_TYPE_CLIMATE: Final = "climate"
 CCO_TYPE_FAN: Final = "fan"
+CCO_TYPES: Final = frozenset(
+    {
+        CCO_TYPE_SWITCH,
+        CCO_TYPE_LIGHT,
+        CCO_TYPE_COVER,
+        CCO_TYPE_LOCK,
+        CCO_TYPE_CLIMATE,
+        CCO_TYPE_FAN,
+    }
+)
 
 # Event names
 EVENT_BUTTON_PRESS: Final = "homeworks_button_press"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 import logging
 from typing import Any
@@ -46,6 +47,9 @@ RPM_MOTOR_UP = 16
 RPM_MOTOR_DOWN = 35
 RPM_MOTOR_STOP = 0
 
+# LED states reported for a keypad that has not sent a KLS yet
+_NO_LED_STATES: tuple[int, ...] = (0,) * 24
+
 
 class HomeworksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for Homeworks data updates.
@@ -83,6 +87,12 @@ class HomeworksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # CCO state cache: unique_key -> bool (is_on)
         self._cco_states: dict[tuple[int, int, int, int], bool] = {}
 
+        # CCO devices indexed by KLS address: [pp:ll:aa] -> {unique_key: CCODevice}
+        # Lets a KLS update reach its devices with a single dict lookup
+        self._kls_cco_devices: dict[
+            str, dict[tuple[int, int, int, int], CCODevice]
+        ] = {}
+
         # Dimmer state cache: address -> level (0-100)
         self._dimmer_states: dict[str, int] = {}
 
@@ -98,6 +108,9 @@ class HomeworksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Addresses that need KLS polling
         self._kls_poll_addresses: set[str] = set()
 
+        # Addresses already asked for initial KLS state by an entity
+        self._kls_initial_requests: set[str] = set()
+
         # Dimmer addresses for polling
         self._dimmer_addresses: set[str] = set()
 
@@ -137,6 +150,7 @@ class HomeworksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Register the KLS address for polling
         kls_addr = device.address.to_kls_address()
+        self._kls_cco_devices.setdefault(kls_addr, {})[key] = device
         self._kls_poll_addresses.add(kls_addr)
         if self._client:
             self._client.register_kls_address(kls_addr)
@@ -154,6 +168,13 @@ class HomeworksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._cco_devices.pop(key, None)
         self._cco_states.pop(key, None)
 
+        kls_addr = address.to_kls_address()
+        devices = self._kls_cco_devices.get(kls_addr)
+        if devices is not None:
+            devices.pop(key, None)
+            if not devices:
+                del self._kls_cco_devices[kls_addr]
+
     def register_dimmer(self, address: str) -> None:
         """Register a dimmer for state tracking."""
         normalized = normalize_address(address)
@@ -175,10 +196,14 @@ class HomeworksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         normalized = normalize_address(address)
         return self._dimmer_states.get(normalized, 0)
 
-    def get_keypad_led_states(self, address: str) -> list[int]:
-        """Get LED states for a keypad."""
+    def get_keypad_led_states(self, address: str) -> Sequence[int]:
+        """Get LED states for a keypad.
+
+        The returned sequence is shared with the state cache and must
+        not be modified.
+        """
         normalized = normalize_address(address)
-        return self._keypad_led_states.get(normalized, [0] * 24)
+        return self._keypad_led_states.get(normalized, _NO_LED_STATES)
 
     def register_cci_device(
         self,
@@ -358,6 +383,8 @@ class HomeworksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.warning("Controller connection lost")
         elif msg_type == HW_CONNECTION_RESTORED:
             _LOGGER.info("Controller connection restored")
+            # Entities may ask for initial KLS state again on the new connection
+            self._kls_initial_requests.clear()
             # Re-poll all states after reconnection
             self.hass.async_create_task(self._poll_all_states())
 
@@ -377,49 +404,34 @@ class HomeworksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self._kls_window_offset,
         )
 
-        # Parse the address to get processor/link/address
-        try:
-            parts = normalized.strip("[]").split(":")
-            processor = int(parts[0])
-            link = int(parts[1])
-            addr = int(parts[2])
-        except (ValueError, IndexError):
-            _LOGGER.warning("Failed to parse KLS address: %s", normalized)
-            return
-
         # Update all CCO devices at this address
         state_changed = False
-        for key, device in self._cco_devices.items():
-            if (
-                device.address.processor == processor
-                and device.address.link == link
-                and device.address.address == addr
-            ):
-                # Get the button state from the button window
-                # The 8 CCO buttons are at indices window_offset to window_offset+7
-                # Button N (1-8) is at index window_offset + (N-1)
-                button = device.address.button
-                if 1 <= button <= 8:
-                    index = self._kls_window_offset + (button - 1)
-                    if index < len(led_states):
-                        led_value = led_states[index]
-                        new_state = device.interpret_state(led_value)
-                        old_state = self._cco_states.get(key)
-
-                        _LOGGER.debug(
-                            "CCO %s (btn=%d idx=%d): LED=%d -> state=%s (was %s, inverted=%s)",
-                            device.name,
-                            button,
-                            index,
-                            led_value,
-                            new_state,
-                            old_state,
-                            device.inverted,
-                        )
-
-                        if old_state != new_state:
-                            self._cco_states[key] = new_state
-                            state_changed = True
+        for key, device in self._kls_cco_devices.get(normalized, {}).items():
+            # Get the button state from the button window
+            # The 8 CCO buttons are at indices window_offset to window_offset+7
+            # Button N (1-8) is at index window_offset + (N-1)
+            button = device.address.button
+            if 1 <= button <= 8:
+                index = self._kls_window_offset + (button - 1)
+                if index < len(led_states):
+                    led_value = led_states[index]
+                    new_state = device.interpret_state(led_value)
+                    old_state = self._cco_states.get(key)
+
+                    _LOGGER.debug(
+                        "CCO %s (btn=%d idx=%d): LED=%d -> state=%s (was %s, inverted=%s)",
+                        device.name,
+                        button,
+                        index,
+                        led_value,
+                        new_state,
+                        old_state,
+                        device.inverted,
+                    )
+
+                    if old_state != new_state:
+                        self._cco_states[key] = new_state
+                        state_changed = True
 
         # Notify listeners if any state changed
         if state_changed:
@@ -647,3 +659,26 @@ class HomeworksCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return False
         normalized = normalize_address(address)
         return await self._client.request_keypad_led_states(normalized)
+
+    async def async_request_initial_keypad_led_states(self, address: str) -> bool:
+        """Request keypad LED states once per keypad for entity setup.
+
+        Several entities usually share a keypad; only the first one added
+        needs to ask, the rest are served by the same KLS response and by
+        the coordinator's bulk poll.
+        """
+        normalized = normalize_address(address)
+        if (
+            normalized in self._kls_initial_requests
+            or normalized in self._keypad_led_states
+        ):
+            return True
+        self._kls_initial_requests.add(normalized)
+        sent = False
+        try:
+            sent = await self.async_request_keypad_led_states(normalized)
+        finally:
+            if not sent:
+                # Not sent (e.g. not connected yet); let the next entity retry
+                self._kls_initial_requests.discard(normalized)
+        return sent
@@ -265,7 +265,7 @@ class HomeworksCCOCover(CoordinatorEntity[HomeworksCoordinator], CoverEntity):
         self.coordinator.register_cco_device(self._device)
 
         # Request initial state
-        await self.coordinator.async_request_keypad_led_states(
+        await self.coordinator.async_request_initial_keypad_led_states(
             self._device.address.to_kls_address()
         )
 
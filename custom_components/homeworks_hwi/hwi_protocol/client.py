@@ -188,9 +188,11 @@ class HomeworksClient:
                 data = await self._transport.read(timeout=1.0)
                 if data:
                     messages = self._parser.feed(data)
-                    for msg in messages:
-                        self._message_count += 1
+                    if messages:
+                        # Messages from one read arrived together
+                        self._message_count += len(messages)
                         self._last_message_at = datetime.now()
+                    for msg in messages:
                         if self._callback:
                             try:
                                 self._callback(msg)
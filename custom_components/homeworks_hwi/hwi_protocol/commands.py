@@ -5,23 +5,14 @@ All commands follow the protocol specification - no invented commands.
 
 Command format: COMMAND, param1, param2, ...
 Terminated with CRLF (handled by transport layer).
+
+normalize_address is re-exported from the protocol module so command callers
+share the parser's memoized normalization.
 """
 
 from __future__ import annotations
 
-
-def normalize_address(address: str) -> str:
-    """Normalize an address to [pp:ll:aa:...] format.
-
-    Examples:
-        1:2:3 -> [01:02:03]
-        [1:2:3] -> [01:02:03]
-    """
-    addr = address.strip("[]")
-    parts = addr.split(":")
-    formatted = ":".join(p.zfill(2) for p in parts)
-    return f"[{formatted}]"
-
+from .protocol import normalize_address  # noqa: F401
 
 # =============================================================================
 # Dimmer Commands
@@ -90,6 +81,11 @@ RPM_MOTOR_UP = 16
 RPM_MOTOR_STOP = 0
 RPM_MOTOR_DOWN = 35
 
+# Motor cover commands differ only by level; prebuild everything but the address
+_MOTOR_COVER_UP_PREFIX = f"FADEDIM, {RPM_MOTOR_UP}, 0, 0, "
+_MOTOR_COVER_DOWN_PREFIX = f"FADEDIM, {RPM_MOTOR_DOWN}, 0, 0, "
+_MOTOR_COVER_STOP_PREFIX = f"FADEDIM, {RPM_MOTOR_STOP}, 0, 0, "
+
 
 def motor_cover_up(address: str) -> str:
     """Build command to raise a motor cover.
@@ -102,7 +98,7 @@ def motor_cover_up(address: str) -> str:
     Returns:
         Command string
     """
-    return f"FADEDIM, {RPM_MOTOR_UP}, 0, 0, {address}"
+    return _MOTOR_COVER_UP_PREFIX + address
 
 
 def motor_cover_down(address: str) -> str:
@@ -116,7 +112,7 @@ def motor_cover_down(address: str) -> str:
     Returns:
         Command string
     """
-    return f"FADEDIM, {RPM_MOTOR_DOWN}, 0, 0, {address}"
+    return _MOTOR_COVER_DOWN_PREFIX + address
 
 
 def motor_cover_stop(address: str) -> str:
@@ -130,7 +126,7 @@ def motor_cover_stop(address: str) -> str:
     Returns:
         Command string
     """
-    return f"FADEDIM, {RPM_MOTOR_STOP}, 0, 0, {address}"
+    return _MOTOR_COVER_STOP_PREFIX + address
 
 
 # =============================================================================
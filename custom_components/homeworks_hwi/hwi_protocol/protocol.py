@@ -11,8 +11,10 @@ All parsing is stateless - just input bytes, output messages.
 from __future__ import annotations
 
 import logging
+import sys
 from datetime import datetime
-from typing import Callable
+from functools import lru_cache
+from typing import Callable, Iterator
 
 from .messages import (
     AnyMessage,
@@ -47,10 +49,22 @@ IGNORED_MESSAGES = frozenset(
     }
 )
 
+# Byte forms of IGNORED_MESSAGES, checked before a line is decoded
+_IGNORED_MESSAGES_BYTES = frozenset(m.encode("ascii") for m in IGNORED_MESSAGES)
 
+# KLS LED digits: translate ASCII digits to their values, delete everything else
+_LED_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+_LED_NON_DIGITS = bytes(c for c in range(256) if c not in b"0123456789")
+
+
+@lru_cache(maxsize=1024)
 def normalize_address(address: str) -> str:
     """Normalize an address to [pp:ll:aa:...] format.
 
+    Results are cached and interned: every message re-normalizes one of a
+    small, fixed set of controller addresses, and the interned result makes
+    later address comparisons and dict lookups pointer-fast.
+
     Examples:
         "1:2:3" -> "[01:02:03]"
         "[1:2:3]" -> "[01:02:03]"
@@ -59,9 +73,10 @@ def normalize_address(address: str) -> str:
     addr = address.strip("[]")
     parts = addr.split(":")
     formatted = ":".join(p.zfill(2) for p in parts)
-    return f"[{formatted}]"
+    return sys.intern(f"[{formatted}]")
 
 
+@lru_cache(maxsize=1024)
 def parse_address(address: str) -> tuple[int, ...]:
     """Parse an address string into integer components.
 
@@ -84,7 +99,10 @@ class MessageParser:
 
     def __init__(self) -> None:
         """Initialize the parser."""
-        self._buffer = b""
+        # Reused across reads: appended in place, consumed from the front
+        self._buffer = bytearray()
+        # End of the last line handed out by an unfinished feed_iter
+        self._offset = 0
 
     def feed(self, data: bytes) -> list[AnyMessage]:
         """Feed bytes to the parser and return any complete messages.
@@ -95,26 +113,58 @@ class MessageParser:
         Returns:
             List of parsed messages (may be empty)
         """
+        return list(self.feed_iter(data))
+
+    def feed_iter(self, data: bytes) -> Iterator[AnyMessage]:
+        """Feed bytes to the parser and iterate complete messages lazily.
+
+        The data is buffered immediately. A line counts as consumed once
+        its message is yielded, so an iterator that is dropped early leaves
+        only the lines after that message for the next feed.
+
+        Args:
+            data: Raw bytes from socket
+
+        Returns:
+            Iterator over parsed messages
+        """
         self._buffer += data
-        messages = []
-
-        while CRLF in self._buffer:
-            line, self._buffer = self._buffer.split(CRLF, 1)
-            if line:
-                try:
-                    msg = self._parse_line(line.decode("utf-8"))
-                    if msg:
-                        messages.append(msg)
-                except UnicodeDecodeError:
-                    _LOGGER.warning("Invalid message encoding: %s", line)
-                except Exception as err:
-                    _LOGGER.warning("Failed to parse message: %s - %s", line, err)
-
-        return messages
+        return self._iter_messages()
+
+    def _iter_messages(self) -> Iterator[AnyMessage]:
+        """Yield messages for each complete line in the buffer."""
+        buffer = self._buffer
+
+        # Walk complete lines by offset and drop the consumed prefix once,
+        # rather than shifting the unparsed tail after every line
+        start = self._offset
+        while (end := buffer.find(CRLF, start)) != -1:
+            line = bytes(buffer[start:end])
+            start = end + len(CRLF)
+            if not line or line in _IGNORED_MESSAGES_BYTES:
+                continue
+            try:
+                msg = self._parse_line(line.decode("utf-8"))
+            except UnicodeDecodeError:
+                _LOGGER.warning("Invalid message encoding: %s", line)
+                continue
+            except Exception as err:
+                _LOGGER.warning("Failed to parse message: %s - %s", line, err)
+                continue
+            if msg:
+                # Record progress first so a later feed never re-parses it
+                self._offset = start
+                yield msg
+                # A feed made while suspended may have compacted the buffer
+                start = self._offset
+        if start:
+            del buffer[:start]
+        self._offset = 0
 
     def reset(self) -> None:
         """Clear the buffer."""
-        self._buffer = b""
+        self._buffer.clear()
+        self._offset = 0
 
     def _parse_line(self, line: str) -> AnyMessage | None:
         """Parse a single line into a message.
@@ -129,8 +179,11 @@ class MessageParser:
         if not line or line in IGNORED_MESSAGES:
             return None
 
-        # Split by comma-space
-        parts = [p.strip() for p in line.split(", ")]
+        # Split by comma-space; fields only need trimming when the
+        # controller padded a separator with extra spaces
+        parts = line.split(", ")
+        if "  " in line or " ," in line:
+            parts = [p.strip() for p in parts]
         if not parts:
             return None
 
@@ -168,7 +221,11 @@ def _parse_kls(line: str, parts: list[str], ts: datetime) -> KLSMessage | None:
 
     # Parse LED states - each character is a digit 0-3
     try:
-        led_states = tuple(int(c) for c in led_string if c.isdigit())
+        led_states = tuple(
+            led_string.encode("ascii", "ignore").translate(
+                _LED_DIGIT_VALUES, _LED_NON_DIGITS
+            )
+        )
         if len(led_states) != 24:
             _LOGGER.warning(
                 "Invalid KLS led states length: %d for %s",
@@ -275,6 +275,6 @@ class HomeworksCCOLight(CoordinatorEntity[HomeworksCoordinator], LightEntity):
         self.coordinator.register_cco_device(self._device)
 
         # Request initial state
-        await self.coordinator.async_request_keypad_led_states(
+        await self.coordinator.async_request_initial_keypad_led_states(
             self._device.address.to_kls_address()
         )
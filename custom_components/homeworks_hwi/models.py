@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum, auto
+from functools import lru_cache
 
 
 class CCOEntityType(Enum):
@@ -71,8 +73,12 @@ class CCOAddress:
         )
 
     def to_kls_address(self) -> str:
-        """Return the [pp:ll:aa] format for KLS matching."""
-        return f"[{self.processor:02d}:{self.link:02d}:{self.address:02d}]"
+        """Return the [pp:ll:aa] format for KLS matching.
+
+        Interned so every platform's copy matches the coordinator's KLS keys
+        by identity.
+        """
+        return sys.intern(f"[{self.processor:02d}:{self.link:02d}:{self.address:02d}]")
 
     def to_command_address(self) -> str:
         """Return address format for CCO commands."""
@@ -287,8 +293,7 @@ class ControllerHealth:
 
     def record_kls(self) -> None:
         """Record that a KLS message was received."""
-        self.last_kls_time = datetime.now(timezone.utc)
-        self.last_message_time = datetime.now(timezone.utc)
+        self.last_kls_time = self.last_message_time = datetime.now(timezone.utc)
 
     def record_reconnect(self) -> None:
         """Record a reconnection event."""
@@ -305,6 +310,7 @@ class ControllerHealth:
         self.last_error = error
 
 
+@lru_cache(maxsize=1024)
 def normalize_address(addr: str) -> str:
     """Normalize Homeworks address format.
 
@@ -163,6 +163,8 @@ class HomeworksCCOSwitch(CoordinatorEntity[HomeworksCoordinator], SwitchEntity):
         super().__init__(coordinator)
         self._device = device
         self._controller_id = controller_id
+        # Keypad this CCO reports through
+        self._kls_address = device.address.to_kls_address()
 
         # Set up entity attributes
         self._entity_name = device.name
@@ -229,6 +231,6 @@ class HomeworksCCOSwitch(CoordinatorEntity[HomeworksCoordinator], SwitchEntity):
         self.coordinator.register_cco_device(self._device)
 
         # Request initial state
-        await self.coordinator.async_request_keypad_led_states(
-            self._device.address.to_kls_address()
+        await self.coordinator.async_request_initial_keypad_led_states(
+            self._kls_address
         )
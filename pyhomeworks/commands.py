@@ -5,23 +5,14 @@ All commands follow the protocol specification - no invented commands.
 
 Command format: COMMAND, param1, param2, ...
 Terminated with CRLF (handled by transport layer).
+
+normalize_address is re-exported from the protocol module so command callers
+share the parser's memoized normalization.
 """
 
 from __future__ import annotations
 
-
-def normalize_address(address: str) -> str:
-    """Normalize an address to [pp:ll:aa:...] format.
-
-    Examples:
-        1:2:3 -> [01:02:03]
-        [1:2:3] -> [01:02:03]
-    """
-    addr = address.strip("[]")
-    parts = addr.split(":")
-    formatted = ":".join(p.zfill(2) for p in parts)
-    return f"[{formatted}]"
-
+from .protocol import normalize_address  # noqa: F401
 
 # =============================================================================
 # Dimmer Commands
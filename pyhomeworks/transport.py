@@ -116,8 +116,7 @@ class HomeworksTransport:
         initial_data = await self._read_available()
 
         # Strip leading CRLF
-        while initial_data.startswith(CRLF):
-            initial_data = initial_data[len(CRLF) :]
+        initial_data = initial_data.lstrip(CRLF)
 
         if initial_data.startswith(LOGIN_REQUEST):
             await self._handle_login()
@@ -154,8 +153,7 @@ class HomeworksTransport:
         response = await self._read_available()
 
         # Strip CRLF
-        while response.startswith(CRLF):
-            response = response[len(CRLF) :]
+        response = response.lstrip(CRLF)
 
         if response.startswith(LOGIN_INCORRECT):
             raise HomeworksInvalidCredentialsProvided("Login failed")
@@ -1,17 +1,42 @@
-"""Pytest configuration for Homeworks tests."""
+"""Pytest configuration for Homeworks tests.
 
-import sys
-from pathlib import Path
+pytest.ini puts custom_components/homeworks_hwi on the path so tests can
+import models directly, and registers the requires_ha marker.
+"""
+
+import asyncio
 
 import pytest
 
-# Add custom_components/homeworks_hwi to path so tests can import models directly
-_repo_root = Path(__file__).parent.parent
-sys.path.insert(0, str(_repo_root / "custom_components" / "homeworks_hwi"))
+from pyhomeworks import MessageParser
+
+_DEFAULT_LOOP_POLICY = pytest.StashKey[asyncio.AbstractEventLoopPolicy]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Run the event loop (and the fake controller's server) on uvloop if available."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    config.stash[_DEFAULT_LOOP_POLICY] = asyncio.get_event_loop_policy()
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Restore the event loop policy replaced in pytest_configure."""
+    if (policy := config.stash.get(_DEFAULT_LOOP_POLICY, None)) is not None:
+        asyncio.set_event_loop_policy(policy)
+
+
+@pytest.fixture(scope="module")
+def shared_parser() -> MessageParser:
+    """Create one MessageParser per test module."""
+    return MessageParser()
 
 
-def pytest_configure(config):
-    """Register custom markers."""
-    config.addinivalue_line(
-        "markers", "requires_ha: mark test as requiring Home Assistant"
-    )
+@pytest.fixture
+def parser(shared_parser: MessageParser) -> MessageParser:
+    """Return the shared parser with an empty buffer."""
+    shared_parser.reset()
+    return shared_parser
@@ -6,6 +6,14 @@ from typing import Callable
 
 _LOGGER = logging.getLogger(__name__)
 
+# LED digits reported for an address whose state was never set
+_DEFAULT_KLS_BYTES = b"0" * 24
+
+
+def _encode_kls(address: str, led_digits: bytes | bytearray) -> bytes:
+    """Encode a KLS response line from ASCII LED digits."""
+    return b"KLS, %s, %s\r\n" % (address.encode("ascii"), led_digits)
+
 
 class FakeHomeworksController:
     """A fake Homeworks controller for testing.
@@ -22,11 +30,15 @@ class FakeHomeworksController:
         self._port = port
         self._require_login = require_login
         self._server: asyncio.Server | None = None
-        self._clients: list[asyncio.StreamWriter] = []
+        self._clients: set[asyncio.StreamWriter] = set()
         self._running = False
+        self._stop_event: asyncio.Event | None = None
 
         # Simulated state
-        self._kls_states: dict[str, list[int]] = {}
+        # LED states as 24 ASCII digits per address
+        self._kls_states: dict[str, bytearray] = {}
+        # Encoded KLS responses, rebuilt whenever an address's state is set
+        self._kls_encoded: dict[str, bytes] = {}
         self._dimmer_levels: dict[str, int] = {}
 
         # Event hooks for testing
@@ -39,7 +51,9 @@ class FakeHomeworksController:
 
     def set_kls_state(self, address: str, led_states: list[int]) -> None:
         """Set the KLS state for an address."""
-        self._kls_states[address] = led_states
+        digits = bytearray(0x30 + s for s in led_states)
+        self._kls_states[address] = digits
+        self._kls_encoded[address] = _encode_kls(address, digits)
 
     def set_dimmer_level(self, address: str, level: int) -> None:
         """Set the dimmer level for an address."""
@@ -53,15 +67,26 @@ class FakeHomeworksController:
             button: The button number (1-24)
             is_on: True for ON (1), False for OFF (2)
         """
-        if address not in self._kls_states:
-            self._kls_states[address] = [0] * 24
+        digits = self._kls_states.get(address)
+        if digits is None:
+            digits = self._kls_states[address] = bytearray(_DEFAULT_KLS_BYTES)
 
         # Set the button state: 1 = ON, 2 = OFF
-        self._kls_states[address][button - 1] = 1 if is_on else 2
+        digits[button - 1] = 0x31 if is_on else 0x32
+        self._kls_encoded[address] = _encode_kls(address, digits)
+
+    def _kls_response(self, address: str) -> bytes:
+        """Return the KLS response for an address."""
+        response = self._kls_encoded.get(address)
+        if response is None:
+            response = _encode_kls(address, _DEFAULT_KLS_BYTES)
+        return response
 
     async def start(self) -> None:
         """Start the fake controller server."""
         self._running = True
+        # Created here so it binds to the running loop
+        self._stop_event = asyncio.Event()
         self._server = await asyncio.start_server(
             self._handle_client,
             "127.0.0.1",
@@ -76,9 +101,11 @@ class FakeHomeworksController:
     async def stop(self) -> None:
         """Stop the fake controller server."""
         self._running = False
+        if self._stop_event:
+            self._stop_event.set()
 
         # Close all client connections
-        for writer in self._clients:
+        for writer in list(self._clients):
             writer.close()
             try:
                 await writer.wait_closed()
@@ -96,8 +123,9 @@ class FakeHomeworksController:
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
         """Handle a client connection."""
-        self._clients.append(writer)
+        self._clients.add(writer)
         _LOGGER.debug("Client connected")
+        stop_wait: asyncio.Task | None = None
 
         try:
             # Send login prompt if required
@@ -115,134 +143,159 @@ class FakeHomeworksController:
                     return
                 await writer.drain()
 
-            # Process commands
-            buffer = b""
+            # Process commands; each read races stop() instead of a timeout
+            stop_wait = asyncio.create_task(self._stop_event.wait())
+            buffer = bytearray()
             while self._running:
+                read = asyncio.create_task(reader.read(65536))
+                done, _ = await asyncio.wait(
+                    {read, stop_wait}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if read not in done:
+                    read.cancel()
+                    break
+
+                data = read.result()
+                if not data:
+                    break
+
+                buffer += data
+
+                # Answer every complete command in this chunk, then drain once
+                responses: list[bytes] = []
                 try:
-                    data = await asyncio.wait_for(reader.read(1024), timeout=1.0)
-                    if not data:
-                        break
-
-                    buffer += data
-
-                    # Process complete commands
-                    while b"\r\n" in buffer:
-                        command, buffer = buffer.split(b"\r\n", 1)
+                    while (end := buffer.find(b"\r\n")) != -1:
+                        command = bytes(buffer[:end])
+                        del buffer[: end + 2]
                         if command:
-                            await self._process_command(
-                                command.decode("utf-8"), writer
-                            )
-
-                except asyncio.TimeoutError:
-                    continue
+                            response = self._process_command(command)
+                            if response:
+                                responses.append(response)
+                finally:
+                    # Replies to commands before a failing one still go out
+                    if responses:
+                        writer.writelines(responses)
+                        await writer.drain()
 
         except Exception as err:
             _LOGGER.debug("Client error: %s", err)
         finally:
-            if writer in self._clients:
-                self._clients.remove(writer)
+            if stop_wait is not None:
+                stop_wait.cancel()
+            self._clients.discard(writer)
             writer.close()
 
-    async def _process_command(
-        self, command: str, writer: asyncio.StreamWriter
-    ) -> None:
-        """Process a command from the client."""
-        _LOGGER.debug("Received command: %s", command)
+    def _process_command(self, command: bytes) -> bytes | None:
+        """Process a command from the client and return its response."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received command: %s", command)
 
         if self._on_command:
-            self._on_command(command)
-
-        parts = command.split(", ")
-        cmd = parts[0].upper()
-
-        if cmd == "PROMPTOFF":
-            pass  # No response needed
-
-        elif cmd == "KBMON":
-            writer.write(b"Keypad button monitoring enabled\r\n")
-            await writer.drain()
-
-        elif cmd == "DLMON":
-            writer.write(b"Dimmer level monitoring enabled\r\n")
-            await writer.drain()
-
-        elif cmd == "KLMON":
-            writer.write(b"Keypad led monitoring enabled\r\n")
-            await writer.drain()
-
-        elif cmd == "GSMON":
-            writer.write(b"GrafikEye scene monitoring enabled\r\n")
-            await writer.drain()
-
-        elif cmd == "RKLS" and len(parts) >= 2:
-            # Request keypad LED states
-            address = parts[1].strip()
-            led_states = self._kls_states.get(address, [0] * 24)
-            led_string = "".join(str(s) for s in led_states)
-            response = f"KLS, {address}, {led_string}\r\n"
-            writer.write(response.encode())
-            await writer.drain()
-
-        elif cmd == "RDL" and len(parts) >= 2:
-            # Request dimmer level
-            address = parts[1].strip()
-            level = self._dimmer_levels.get(address, 0)
-            response = f"DL, {address}, {level}\r\n"
-            writer.write(response.encode())
-            await writer.drain()
-
-        elif cmd == "CCOCLOSE" and len(parts) >= 3:
-            # Close CCO relay
-            address = parts[1].strip()
-            button = int(parts[2].strip())
-            self.set_cco_state(address, button, True)
-
-            # Send KLS update
-            led_states = self._kls_states.get(address, [0] * 24)
-            led_string = "".join(str(s) for s in led_states)
-            response = f"KLS, {address}, {led_string}\r\n"
-            writer.write(response.encode())
-            await writer.drain()
-
-        elif cmd == "CCOOPEN" and len(parts) >= 3:
-            # Open CCO relay
-            address = parts[1].strip()
-            button = int(parts[2].strip())
-            self.set_cco_state(address, button, False)
-
-            # Send KLS update
-            led_states = self._kls_states.get(address, [0] * 24)
-            led_string = "".join(str(s) for s in led_states)
-            response = f"KLS, {address}, {led_string}\r\n"
-            writer.write(response.encode())
-            await writer.drain()
-
-        elif cmd == "FADEDIM" and len(parts) >= 5:
-            # Fade dimmer
-            level = int(float(parts[1].strip()))
-            address = parts[4].strip()
-            self._dimmer_levels[address] = level
-
-            # Send DL update
-            response = f"DL, {address}, {level}\r\n"
-            writer.write(response.encode())
-            await writer.drain()
+            self._on_command(command.decode("utf-8"))
+
+        # Only the verb is needed to dispatch; arguments stay undecoded
+        verb, _, args = command.partition(b", ")
+        handler = _COMMAND_HANDLERS.get(verb.upper())
+        if handler is None:
+            return None
+        return handler(self, args)
+
+    def _cmd_rkls(self, args: bytes) -> bytes | None:
+        """Request keypad LED states."""
+        if not args:
+            return None
+        return self._kls_response(_address(args.split(b", ", 1)[0]))
+
+    def _cmd_rdl(self, args: bytes) -> bytes | None:
+        """Request dimmer level."""
+        if not args:
+            return None
+        address = _address(args.split(b", ", 1)[0])
+        level = self._dimmer_levels.get(address, 0)
+        return f"DL, {address}, {level}\r\n".encode()
+
+    def _cmd_cco_close(self, args: bytes) -> bytes | None:
+        """Close CCO relay and send KLS update."""
+        fields = args.split(b", ")
+        if len(fields) < 2:
+            return None
+        address = _address(fields[0])
+        self.set_cco_state(address, int(fields[1]), True)
+        return self._kls_response(address)
+
+    def _cmd_cco_open(self, args: bytes) -> bytes | None:
+        """Open CCO relay and send KLS update."""
+        fields = args.split(b", ")
+        if len(fields) < 2:
+            return None
+        address = _address(fields[0])
+        self.set_cco_state(address, int(fields[1]), False)
+        return self._kls_response(address)
+
+    def _cmd_fadedim(self, args: bytes) -> bytes | None:
+        """Fade dimmer and send DL update."""
+        fields = args.split(b", ")
+        if len(fields) < 4:
+            return None
+        level = _parse_level(fields[0])
+        address = _address(fields[3])
+        self._dimmer_levels[address] = level
+        return f"DL, {address}, {level}\r\n".encode()
 
     async def simulate_kls_change(self, address: str) -> None:
         """Simulate a KLS change (broadcast to all clients)."""
-        led_states = self._kls_states.get(address, [0] * 24)
-        led_string = "".join(str(s) for s in led_states)
-        message = f"KLS, {address}, {led_string}\r\n"
+        message = self._kls_response(address)
 
-        for writer in self._clients:
+        # Queue the message on every client first, then drain them together
+        writers = list(self._clients)
+        for writer in writers:
             try:
-                writer.write(message.encode())
-                await writer.drain()
+                writer.write(message)
             except Exception:
                 pass
+        await asyncio.gather(
+            *(writer.drain() for writer in writers), return_exceptions=True
+        )
 
     async def simulate_disconnect(self) -> None:
         """Simulate a disconnect (close all client connections)."""
-        for writer in self._clients:
+        for writer in list(self._clients):
             writer.close()
         self._clients.clear()
+
+
+def _address(field: bytes) -> str:
+    """Decode an address argument."""
+    return field.strip().decode("ascii")
+
+
+def _parse_level(field: bytes) -> int:
+    """Parse a level argument, accepting fractional values like 50.0."""
+    try:
+        return int(field)
+    except ValueError:
+        return int(float(field))
+
+
+def _static_response(
+    response: bytes | None,
+) -> Callable[[FakeHomeworksController, bytes], bytes | None]:
+    """Create a handler that always returns the same response."""
+    return lambda controller, args: response
+
+
+# Map command verbs to handlers
+_COMMAND_HANDLERS: dict[
+    bytes, Callable[[FakeHomeworksController, bytes], bytes | None]
+] = {
+    b"PROMPTOFF": _static_response(None),  # No response needed
+    b"KBMON": _static_response(b"Keypad button monitoring enabled\r\n"),
+    b"DLMON": _static_response(b"Dimmer level monitoring enabled\r\n"),
+    b"KLMON": _static_response(b"Keypad led monitoring enabled\r\n"),
+    b"GSMON": _static_response(b"GrafikEye scene monitoring enabled\r\n"),
+    b"RKLS": FakeHomeworksController._cmd_rkls,
+    b"RDL": FakeHomeworksController._cmd_rdl,
+    b"CCOCLOSE": FakeHomeworksController._cmd_cco_close,
+    b"CCOOPEN": FakeHomeworksController._cmd_cco_open,
+    b"FADEDIM": FakeHomeworksController._cmd_fadedim,
+}
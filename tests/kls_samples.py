@@ -0,0 +1,27 @@
+"""Sample KLS frames shared by the protocol, model and benchmark tests.
+
+Both samples come from the same protocol capture and differ only at
+button 6 of the CCO window (digit 2 = OFF in sample 1, 1 = ON in sample 2).
+"""
+
+from datetime import datetime
+
+
+def kls_decode(digits: str) -> tuple[int, ...]:
+    """Decode a KLS digit string by ASCII offset instead of int() per char."""
+    return tuple(b - 48 for b in digits.encode("ascii"))
+
+
+SAMPLE1_DIGITS = "000000000222112110000000"
+SAMPLE2_DIGITS = "000000000222111110000000"
+
+# The two sample KLS digit strings, parsed once
+SAMPLE1_LEDS = kls_decode(SAMPLE1_DIGITS)
+SAMPLE2_LEDS = kls_decode(SAMPLE2_DIGITS)
+
+# The same samples as complete RS-232 lines
+SAMPLE1_BYTES = f"KLS, [02:06:03], {SAMPLE1_DIGITS}\r\n".encode("ascii")
+SAMPLE2_BYTES = f"KLS, [02:06:03], {SAMPLE2_DIGITS}\r\n".encode("ascii")
+
+# Fixed reference time so KLSState construction never reads the clock
+FIXED_TS = datetime(2024, 1, 1)
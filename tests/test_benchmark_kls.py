@@ -0,0 +1,41 @@
+"""Micro-benchmarks for the KLS hot path.
+
+These need a benchmark plugin and are skipped without one:
+    pip install pytest-codspeed
+    pytest tests/test_benchmark_kls.py --codspeed
+"""
+
+from importlib.util import find_spec
+
+import pytest
+
+if find_spec("pytest_codspeed") is None and find_spec("pytest_benchmark") is None:
+    pytest.skip("No benchmark plugin installed", allow_module_level=True)
+
+from models import KLSState  # noqa: E402
+from pyhomeworks import MessageParser  # noqa: E402
+
+from kls_samples import FIXED_TS, SAMPLE1_BYTES, SAMPLE1_LEDS  # noqa: E402
+
+
+def test_bench_parse_kls(benchmark):
+    """Parse a 100-line burst of KLS messages."""
+    parser = MessageParser()
+    data = SAMPLE1_BYTES * 100
+
+    @benchmark
+    def parse():
+        parser.feed(data)
+        parser.reset()
+
+
+def test_bench_get_cco_state(benchmark):
+    """Read every CCO button in the window of one KLS state."""
+    kls = KLSState(
+        address="[02:06:03]", led_states=list(SAMPLE1_LEDS), timestamp=FIXED_TS
+    )
+
+    @benchmark
+    def read_buttons():
+        for button in range(1, 9):
+            kls.get_cco_state(button)
@@ -1,29 +1,92 @@
-"""Tests for the Homeworks async client.
+"""Tests for the Homeworks async client against the fake controller.
 
-These tests require Home Assistant and are skipped when HA is not installed.
+These tests run WITHOUT Home Assistant dependencies.
 """
 
+import asyncio
+
 import pytest
 
-# Mark entire module as requiring HA
-pytestmark = pytest.mark.requires_ha
+from pyhomeworks import AnyMessage, DimmerLevelMessage, HomeworksClient, KLSMessage
+
+from fake_controller import FakeHomeworksController
 
 
 @pytest.fixture
 async def fake_controller():
     """Create and start a fake controller."""
-    from .fake_controller import FakeHomeworksController
     controller = FakeHomeworksController(port=0)
     await controller.start()
     yield controller
     await controller.stop()
 
 
-# These tests are placeholders - they require HA for the full client
+@pytest.fixture
+async def client_messages(fake_controller):
+    """Connect a client to the fake controller and collect its messages."""
+    messages: asyncio.Queue[AnyMessage] = asyncio.Queue()
+    client = HomeworksClient(
+        "127.0.0.1", fake_controller.port, callback=messages.put_nowait
+    )
+    assert await client.connect()
+    await client.start()
+    yield client, messages
+    await client.stop()
+
+
+async def _next_message(messages: asyncio.Queue, kind: type) -> AnyMessage:
+    """Return the next queued message of the given type."""
+
+    async def wait() -> AnyMessage:
+        while not isinstance(msg := await messages.get(), kind):
+            pass
+        return msg
+
+    return await asyncio.wait_for(wait(), timeout=2.0)
+
+
 class TestHomeworksClientIntegration:
-    """Integration tests for HomeworksClient (requires HA)."""
+    """Round trips between HomeworksClient and the fake controller."""
+
+    async def test_cco_close_reports_kls(self, client_messages):
+        client, messages = client_messages
+
+        assert await client.cco_close("[02:06:03]", 1)
+
+        msg = await _next_message(messages, KLSMessage)
+        assert msg.address == "[02:06:03]"
+        assert msg.led_states[0] == 1
+
+    async def test_fade_dim_reports_level(self, client_messages):
+        client, messages = client_messages
+
+        assert await client.fade_dim("[01:01:00:02:04]", 50.0)
+
+        msg = await _next_message(messages, DimmerLevelMessage)
+        assert msg.address == "[01:01:00:02:04]"
+        assert msg.level == 50
+
+    async def test_request_keypad_led_states(self, fake_controller, client_messages):
+        client, messages = client_messages
+        fake_controller.set_kls_state("[02:06:03]", [0] * 9 + [2, 2, 2, 1] + [0] * 11)
+
+        assert await client.request_keypad_led_states("[02:06:03]")
+
+        msg = await _next_message(messages, KLSMessage)
+        assert msg.led_states[9:13] == (2, 2, 2, 1)
+
+
+class TestFakeController:
+    """Behavior of the fake controller itself."""
+
+    async def test_bad_command_keeps_earlier_replies(self, fake_controller):
+        """A command that fails to process does not drop replies before it."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", fake_controller.port)
+        try:
+            writer.write(b"RKLS, [02:06:03]\r\nFADEDIM, bad, 0, 0, [01:01:00:02:04]\r\n")
+            await writer.drain()
 
-    @pytest.mark.asyncio
-    async def test_placeholder(self):
-        """Placeholder test - actual tests require HA."""
-        pytest.skip("Full client tests require Home Assistant")
+            line = await asyncio.wait_for(reader.readline(), timeout=2.0)
+            assert line == b"KLS, [02:06:03], " + b"0" * 24 + b"\r\n"
+        finally:
+            writer.close()
@@ -4,26 +4,69 @@ These tests verify that adding, editing, and deleting devices
 correctly updates the options schema, without requiring Home Assistant.
 """
 
+import csv
+from functools import cache
+from io import StringIO
+from typing import Callable
+
 import pytest
-from copy import deepcopy
 
 # Import models and constants (no HA deps)
+from const import CCO_TYPES
 from pyhomeworks import normalize_address
 
 
-# Simulate the options dictionary structure used by config_flow
+# Simulate the options dictionary structure used by config_flow.
+# Only scalars live in the template; list fields are created fresh per copy.
+_EMPTY_OPTIONS_TEMPLATE = {
+    "controller_id": "test_controller",
+    "host": "192.168.1.100",
+    "port": 23,
+    "kls_poll_interval": 10,
+    "kls_window_offset": 9,
+}
+
+
 def create_empty_options() -> dict:
     """Create an empty options dict matching the config_flow structure."""
-    return {
-        "controller_id": "test_controller",
-        "host": "192.168.1.100",
-        "port": 23,
-        "cco_devices": [],
-        "dimmers": [],
-        "keypads": [],
-        "kls_poll_interval": 10,
-        "kls_window_offset": 9,
-    }
+    options = _EMPTY_OPTIONS_TEMPLATE.copy()
+    options["cco_devices"] = []
+    options["dimmers"] = []
+    options["keypads"] = []
+    return options
+
+
+@pytest.fixture
+def empty_options() -> dict:
+    """Return a fresh empty options dict."""
+    return create_empty_options()
+
+
+_SAMPLE_CCO = {
+    "name": "Test Device",
+    "addr": "[02:06:03]",
+    "button_number": 6,
+    "entity_type": "switch",
+    "inverted": False,
+}
+
+
+@pytest.fixture
+def one_cco_options(empty_options: dict) -> dict:
+    """Return options holding a single CCO switch at [02:06:03] button 6."""
+    empty_options["cco_devices"].append(_SAMPLE_CCO.copy())
+    return empty_options
+
+
+@pytest.fixture
+def one_keypad_options(empty_options: dict) -> dict:
+    """Return options holding a single keypad with no buttons."""
+    empty_options["keypads"].append({
+        "name": "Test Keypad",
+        "addr": "[01:04:10]",
+        "buttons": [],
+    })
+    return empty_options
 
 
 # === CCO Device CRUD ===
@@ -32,9 +75,9 @@ def create_empty_options() -> dict:
 class TestCCODeviceCRUD:
     """Tests for CCO device create/read/update/delete operations."""
 
-    def test_add_cco_device(self):
+    def test_add_cco_device(self, empty_options):
         """Test adding a CCO device to options."""
-        options = create_empty_options()
+        options = empty_options
 
         # Add a CCO switch
         new_device = {
@@ -51,9 +94,9 @@ class TestCCODeviceCRUD:
         assert options["cco_devices"][0]["addr"] == "[02:06:03]"
         assert options["cco_devices"][0]["button_number"] == 6
 
-    def test_add_multiple_cco_devices(self):
+    def test_add_multiple_cco_devices(self, empty_options):
         """Test adding multiple CCO devices."""
-        options = create_empty_options()
+        options = empty_options
 
         devices = [
             {"name": "Switch 1", "addr": "[02:06:03]", "button_number": 1, "entity_type": "switch", "inverted": False},
@@ -69,78 +112,27 @@ class TestCCODeviceCRUD:
         assert options["cco_devices"][2]["entity_type"] == "cover"
         assert options["cco_devices"][2]["inverted"] is True
 
-    def test_edit_cco_device_name(self):
-        """Test editing a CCO device name preserves other fields."""
-        options = create_empty_options()
-        options["cco_devices"].append({
-            "name": "Original Name",
-            "addr": "[02:06:03]",
-            "button_number": 6,
-            "entity_type": "switch",
-            "inverted": False,
-        })
-
-        # Edit the name
-        options["cco_devices"][0]["name"] = "New Name"
-
-        assert options["cco_devices"][0]["name"] == "New Name"
-        assert options["cco_devices"][0]["addr"] == "[02:06:03]"
-        assert options["cco_devices"][0]["button_number"] == 6
-        assert options["cco_devices"][0]["entity_type"] == "switch"
-
-    def test_edit_cco_device_entity_type(self):
-        """Test changing entity type (switch -> light)."""
-        options = create_empty_options()
-        options["cco_devices"].append({
-            "name": "Test Device",
-            "addr": "[02:06:03]",
-            "button_number": 6,
-            "entity_type": "switch",
-            "inverted": False,
-        })
-
-        # Change entity type
-        options["cco_devices"][0]["entity_type"] = "light"
-
-        assert options["cco_devices"][0]["entity_type"] == "light"
-
-    def test_edit_cco_device_inversion(self):
-        """Test toggling inversion."""
-        options = create_empty_options()
-        options["cco_devices"].append({
-            "name": "Test Device",
-            "addr": "[02:06:03]",
-            "button_number": 6,
-            "entity_type": "switch",
-            "inverted": False,
-        })
-
-        # Toggle inversion
-        options["cco_devices"][0]["inverted"] = True
-
-        assert options["cco_devices"][0]["inverted"] is True
-
-    def test_edit_cco_device_address_and_button(self):
-        """Test changing address and button number."""
-        options = create_empty_options()
-        options["cco_devices"].append({
-            "name": "Test Device",
-            "addr": "[02:06:03]",
-            "button_number": 6,
-            "entity_type": "switch",
-            "inverted": False,
-        })
-
-        # Change address and button
-        options["cco_devices"][0]["addr"] = "[02:06:04]"
-        options["cco_devices"][0]["button_number"] = 1
-
-        assert options["cco_devices"][0]["addr"] == "[02:06:04]"
-        assert options["cco_devices"][0]["button_number"] == 1
-
-    def test_delete_cco_device(self):
+    @pytest.mark.parametrize(
+        ("field", "new_value"),
+        [
+            ("name", "New Name"),
+            ("entity_type", "light"),
+            ("inverted", True),
+            ("addr", "[02:06:04]"),
+            ("button_number", 1),
+        ],
+    )
+    def test_edit_cco_device(self, one_cco_options, field, new_value):
+        """Test editing one CCO device field preserves the others."""
+        options = one_cco_options
+
+        options["cco_devices"][0][field] = new_value
+
+        assert options["cco_devices"][0] == {**_SAMPLE_CCO, field: new_value}
+
+    def test_delete_cco_device(self, empty_options):
         """Test deleting a CCO device."""
-        options = create_empty_options()
+        options = empty_options
         options["cco_devices"] = [
             {"name": "Device 1", "addr": "[02:06:03]", "button_number": 1, "entity_type": "switch", "inverted": False},
             {"name": "Device 2", "addr": "[02:06:03]", "button_number": 2, "entity_type": "light", "inverted": False},
@@ -154,9 +146,9 @@ class TestCCODeviceCRUD:
         assert options["cco_devices"][0]["name"] == "Device 1"
         assert options["cco_devices"][1]["name"] == "Device 3"
 
-    def test_delete_multiple_cco_devices(self):
+    def test_delete_multiple_cco_devices(self, empty_options):
         """Test deleting multiple CCO devices."""
-        options = create_empty_options()
+        options = empty_options
         options["cco_devices"] = [
             {"name": "Device 0", "addr": "[02:06:03]", "button_number": 1, "entity_type": "switch", "inverted": False},
             {"name": "Device 1", "addr": "[02:06:03]", "button_number": 2, "entity_type": "light", "inverted": False},
@@ -166,18 +158,16 @@ class TestCCODeviceCRUD:
 
         # Delete indices 1 and 3 (must delete in reverse order to preserve indices)
         indices_to_delete = {1, 3}
-        options["cco_devices"] = [
-            dev for idx, dev in enumerate(options["cco_devices"])
-            if idx not in indices_to_delete
-        ]
+        for idx in sorted(indices_to_delete, reverse=True):
+            del options["cco_devices"][idx]
 
         assert len(options["cco_devices"]) == 2
         assert options["cco_devices"][0]["name"] == "Device 0"
         assert options["cco_devices"][1]["name"] == "Device 2"
 
-    def test_duplicate_detection(self):
+    def test_duplicate_detection(self, empty_options):
         """Test that we can detect duplicate address+button combinations."""
-        options = create_empty_options()
+        options = empty_options
         options["cco_devices"] = [
             {"name": "Device 1", "addr": "[02:06:03]", "button_number": 6, "entity_type": "switch", "inverted": False},
         ]
@@ -186,11 +176,12 @@ class TestCCODeviceCRUD:
         new_addr = "[02:06:03]"
         new_button = 6
 
+        existing_keys = {
+            (dev["addr"], dev["button_number"]) for dev in options["cco_devices"]
+        }
+
         def is_duplicate(addr: str, button: int) -> bool:
-            for dev in options["cco_devices"]:
-                if dev["addr"] == addr and dev["button_number"] == button:
-                    return True
-            return False
+            return (addr, button) in existing_keys
 
         assert is_duplicate(new_addr, new_button) is True
         assert is_duplicate("[02:06:03]", 5) is False
@@ -203,9 +194,9 @@ class TestCCODeviceCRUD:
 class TestDimmerCRUD:
     """Tests for dimmable light create/read/update/delete operations."""
 
-    def test_add_dimmer(self):
+    def test_add_dimmer(self, empty_options):
         """Test adding a dimmable light."""
-        options = create_empty_options()
+        options = empty_options
 
         new_dimmer = {
             "name": "Living Room Dimmer",
@@ -218,9 +209,9 @@ class TestDimmerCRUD:
         assert options["dimmers"][0]["name"] == "Living Room Dimmer"
         assert options["dimmers"][0]["rate"] == 2.0
 
-    def test_edit_dimmer_rate(self):
+    def test_edit_dimmer_rate(self, empty_options):
         """Test editing dimmer fade rate."""
-        options = create_empty_options()
+        options = empty_options
         options["dimmers"].append({
             "name": "Test Dimmer",
             "addr": "[01:01:00:02:04]",
@@ -233,9 +224,9 @@ class TestDimmerCRUD:
         assert options["dimmers"][0]["rate"] == 3.5
         assert options["dimmers"][0]["name"] == "Test Dimmer"
 
-    def test_edit_dimmer_name(self):
+    def test_edit_dimmer_name(self, empty_options):
         """Test editing dimmer name."""
-        options = create_empty_options()
+        options = empty_options
         options["dimmers"].append({
             "name": "Old Name",
             "addr": "[01:01:00:02:04]",
@@ -246,9 +237,9 @@ class TestDimmerCRUD:
 
         assert options["dimmers"][0]["name"] == "New Name"
 
-    def test_delete_dimmer(self):
+    def test_delete_dimmer(self, empty_options):
         """Test deleting a dimmer."""
-        options = create_empty_options()
+        options = empty_options
         options["dimmers"] = [
             {"name": "Dimmer 1", "addr": "[01:01:00:02:01]", "rate": 1.0},
             {"name": "Dimmer 2", "addr": "[01:01:00:02:02]", "rate": 1.0},
@@ -259,19 +250,17 @@ class TestDimmerCRUD:
         assert len(options["dimmers"]) == 1
         assert options["dimmers"][0]["name"] == "Dimmer 2"
 
-    def test_dimmer_address_duplicate_detection(self):
+    def test_dimmer_address_duplicate_detection(self, empty_options):
         """Test duplicate dimmer address detection."""
-        options = create_empty_options()
+        options = empty_options
         options["dimmers"] = [
             {"name": "Dimmer 1", "addr": "[01:01:00:02:04]", "rate": 1.0},
         ]
 
+        existing_addrs = {normalize_address(dim["addr"]) for dim in options["dimmers"]}
+
         def is_duplicate_dimmer(addr: str) -> bool:
-            normalized = normalize_address(addr)
-            for dim in options["dimmers"]:
-                if normalize_address(dim["addr"]) == normalized:
-                    return True
-            return False
+            return normalize_address(addr) in existing_addrs
 
         assert is_duplicate_dimmer("[01:01:00:02:04]") is True
         assert is_duplicate_dimmer("1:1:0:2:4") is True  # Different format, same address
@@ -284,9 +273,9 @@ class TestDimmerCRUD:
 class TestKeypadCRUD:
     """Tests for keypad create/read/update/delete operations."""
 
-    def test_add_keypad(self):
+    def test_add_keypad(self, empty_options):
         """Test adding a keypad."""
-        options = create_empty_options()
+        options = empty_options
 
         new_keypad = {
             "name": "Entry Keypad",
@@ -299,14 +288,9 @@ class TestKeypadCRUD:
         assert options["keypads"][0]["name"] == "Entry Keypad"
         assert options["keypads"][0]["buttons"] == []
 
-    def test_add_button_to_keypad(self):
+    def test_add_button_to_keypad(self, one_keypad_options):
         """Test adding a button to a keypad."""
-        options = create_empty_options()
-        options["keypads"].append({
-            "name": "Test Keypad",
-            "addr": "[01:04:10]",
-            "buttons": [],
-        })
+        options = one_keypad_options
 
         # Add button
         options["keypads"][0]["buttons"].append({
@@ -320,9 +304,9 @@ class TestKeypadCRUD:
         assert options["keypads"][0]["buttons"][0]["name"] == "Scene 1"
         assert options["keypads"][0]["buttons"][0]["led"] is True
 
-    def test_edit_keypad_button(self):
+    def test_edit_keypad_button(self, empty_options):
         """Test editing a keypad button."""
-        options = create_empty_options()
+        options = empty_options
         options["keypads"].append({
             "name": "Test Keypad",
             "addr": "[01:04:10]",
@@ -339,9 +323,9 @@ class TestKeypadCRUD:
         assert options["keypads"][0]["buttons"][0]["led"] is True
         assert options["keypads"][0]["buttons"][0]["number"] == 1
 
-    def test_delete_button_from_keypad(self):
+    def test_delete_button_from_keypad(self, empty_options):
         """Test deleting a button from a keypad."""
-        options = create_empty_options()
+        options = empty_options
         options["keypads"].append({
             "name": "Test Keypad",
             "addr": "[01:04:10]",
@@ -356,9 +340,9 @@ class TestKeypadCRUD:
         assert len(options["keypads"][0]["buttons"]) == 1
         assert options["keypads"][0]["buttons"][0]["name"] == "Button 2"
 
-    def test_delete_keypad_removes_buttons(self):
+    def test_delete_keypad_removes_buttons(self, empty_options):
         """Test that deleting a keypad also removes its buttons."""
-        options = create_empty_options()
+        options = empty_options
         options["keypads"] = [
             {
                 "name": "Keypad 1",
@@ -384,9 +368,9 @@ class TestKeypadCRUD:
         assert options["keypads"][0]["name"] == "Keypad 2"
         assert len(options["keypads"][0]["buttons"]) == 1
 
-    def test_button_number_duplicate_detection(self):
+    def test_button_number_duplicate_detection(self, empty_options):
         """Test duplicate button number detection on same keypad."""
-        options = create_empty_options()
+        options = empty_options
         options["keypads"].append({
             "name": "Test Keypad",
             "addr": "[01:04:10]",
@@ -396,11 +380,12 @@ class TestKeypadCRUD:
             ],
         })
 
+        existing_numbers = [
+            {btn["number"] for btn in keypad["buttons"]} for keypad in options["keypads"]
+        ]
+
         def is_duplicate_button(keypad_idx: int, number: int) -> bool:
-            for btn in options["keypads"][keypad_idx]["buttons"]:
-                if btn["number"] == number:
-                    return True
-            return False
+            return number in existing_numbers[keypad_idx]
 
         assert is_duplicate_button(0, 1) is True
         assert is_duplicate_button(0, 5) is True
@@ -413,25 +398,25 @@ class TestKeypadCRUD:
 class TestControllerSettings:
     """Tests for controller settings updates."""
 
-    def test_update_kls_poll_interval(self):
+    def test_update_kls_poll_interval(self, empty_options):
         """Test updating KLS poll interval."""
-        options = create_empty_options()
+        options = empty_options
 
         options["kls_poll_interval"] = 30
 
         assert options["kls_poll_interval"] == 30
 
-    def test_update_kls_window_offset(self):
+    def test_update_kls_window_offset(self, empty_options):
         """Test updating KLS window offset."""
-        options = create_empty_options()
+        options = empty_options
 
         options["kls_window_offset"] = 8
 
         assert options["kls_window_offset"] == 8
 
-    def test_settings_persistence(self):
+    def test_settings_persistence(self, empty_options):
         """Test that settings persist across device changes."""
-        options = create_empty_options()
+        options = empty_options
         options["kls_poll_interval"] = 15
         options["kls_window_offset"] = 10
 
@@ -452,13 +437,24 @@ class TestControllerSettings:
 # === Schema Validation ===
 
 
+REQUIRED_CCO_FIELDS = frozenset(
+    {"name", "addr", "button_number", "entity_type", "inverted"}
+)
+VALID_CCO_ENTITY_TYPES = frozenset({"switch", "light", "cover", "lock"})
+_CCO_DEVICE_TEMPLATE = {
+    "name": "Test",
+    "addr": "[02:06:03]",
+    "button_number": 1,
+    "entity_type": "switch",
+    "inverted": False,
+}
+
+
 class TestSchemaValidation:
     """Tests for options schema validation."""
 
     def test_required_cco_fields(self):
         """Test that CCO devices require specific fields."""
-        required_fields = ["name", "addr", "button_number", "entity_type", "inverted"]
-
         device = {
             "name": "Test",
             "addr": "[02:06:03]",
@@ -467,45 +463,37 @@ class TestSchemaValidation:
             "inverted": False,
         }
 
-        for field in required_fields:
-            assert field in device
+        assert REQUIRED_CCO_FIELDS <= device.keys()
 
     def test_cco_entity_types_valid(self):
         """Test that entity type values are valid."""
-        valid_types = {"switch", "light", "cover", "lock"}
-
-        for etype in valid_types:
-            device = {
-                "name": "Test",
-                "addr": "[02:06:03]",
-                "button_number": 1,
-                "entity_type": etype,
-                "inverted": False,
-            }
-            assert device["entity_type"] in valid_types
-
-    def test_button_number_range(self):
+        assert VALID_CCO_ENTITY_TYPES <= CCO_TYPES
+
+        for etype in VALID_CCO_ENTITY_TYPES:
+            device = {**_CCO_DEVICE_TEMPLATE, "entity_type": etype}
+            assert device["entity_type"] in CCO_TYPES
+
+    @pytest.mark.parametrize("num", range(1, 25))
+    def test_button_number_range(self, num):
         """Test button number validation (1-24)."""
-        for num in range(1, 25):
-            # Valid range
-            device = {
-                "name": "Test",
-                "addr": "[02:06:03]",
-                "button_number": num,
-                "entity_type": "switch",
-                "inverted": False,
-            }
-            assert 1 <= device["button_number"] <= 24
-
-    def test_dimmer_rate_range(self):
+        device = {
+            "name": "Test",
+            "addr": "[02:06:03]",
+            "button_number": num,
+            "entity_type": "switch",
+            "inverted": False,
+        }
+        assert 1 <= device["button_number"] <= 24
+
+    @pytest.mark.parametrize("rate", [0, 0.5, 1.0, 5.0, 10.0, 20.0])
+    def test_dimmer_rate_range(self, rate):
         """Test dimmer rate validation (0-20)."""
-        for rate in [0, 0.5, 1.0, 5.0, 10.0, 20.0]:
-            dimmer = {
-                "name": "Test",
-                "addr": "[01:01:00:02:04]",
-                "rate": rate,
-            }
-            assert 0 <= dimmer["rate"] <= 20
+        dimmer = {
+            "name": "Test",
+            "addr": "[01:01:00:02:04]",
+            "rate": rate,
+        }
+        assert 0 <= dimmer["rate"] <= 20
 
 
 # === Migration Support ===
@@ -514,9 +502,9 @@ class TestSchemaValidation:
 class TestLegacyMigration:
     """Tests for legacy options format migration."""
 
-    def test_legacy_ccos_key_exists(self):
+    def test_legacy_ccos_key_exists(self, empty_options):
         """Test that legacy 'ccos' key can coexist with 'cco_devices'."""
-        options = create_empty_options()
+        options = empty_options
         options["ccos"] = []  # Legacy key
         options["covers"] = []  # Legacy key
         options["locks"] = []  # Legacy key
@@ -586,22 +574,56 @@ class TestLegacyMigration:
 # === CSV Import Tests ===
 
 
+BASIC_SWITCH_CSV = """device_type,address,relay,name
+CCO,02:06:03,6,Kitchen Light"""
+
+TYPED_CCO_CSV = """device_type,address,relay,name,type
+CCO,02:06:03,6,Kitchen Light,switch
+CCO,02:06:04,1,Garage Door,cover
+CCO,02:06:05,2,Front Door,lock
+CCO,02:06:06,3,Thermostat,climate
+CCO,02:06:07,4,Bedroom Light,light"""
+
+DIMMER_CSV = """device_type,address,name
+DIMMER,01:01:00:02:04,Living Room
+LIGHT,01:01:00:02:05,Dining Room"""
+
+MIXED_DEVICES_CSV = """device_type,address,relay,name,type
+CCO,02:06:03,6,Kitchen Light,switch
+DIMMER,01:01:00:02:04,,Living Room,
+COVER,02:06:04,1,Garage Door,
+LOCK,02:06:05,2,Front Door,
+CLIMATE,02:06:06,3,Thermostat,"""
+
+ADDRESS_FORMATS_CSV = """device_type,address,relay,name
+CCO,2:6:3,6,Test1
+CCO,[02:06:03],7,Test2
+CCO,02:06:03,8,Test3"""
+
+DUPLICATE_CCO_CSV = """device_type,address,relay,name,type
+CCO,02:06:03,6,Kitchen Light,switch
+CCO,02:06:03,7,Different Button,switch
+CCO,02:06:04,6,Different Address,switch"""
+
+
+# CSV device_type values with a fixed CCO entity type, and dimmer aliases
+_DEVICE_TYPE_MAP = {"COVER": "cover", "LOCK": "lock", "CLIMATE": "climate"}
+_DIMMER_TYPES = frozenset({"LIGHT", "DIMMER"})
+
+
+@cache
+def _parse_csv(content: str, reader: Callable = csv.DictReader) -> tuple:
+    """Return a module CSV constant's rows, parsing each constant only once."""
+    return tuple(reader(StringIO(content)))
+
+
 class TestCSVImport:
     """Tests for CSV import functionality."""
 
     def test_parse_csv_basic_switch(self):
         """Test parsing a basic switch from CSV."""
-        csv_content = """device_type,address,relay,name
-CCO,02:06:03,6,Kitchen Light"""
-
-        import csv
-        from io import StringIO
-
-        f = StringIO(csv_content)
-        reader = csv.DictReader(f)
-
         devices = []
-        for row in reader:
+        for row in _parse_csv(BASIC_SWITCH_CSV):
             device_type = row.get("device_type", "").strip().upper()
             if device_type in ("CCO", "SWITCH"):
                 button = int(row.get("relay", row.get("button", 1)))
@@ -622,21 +644,8 @@ CCO,02:06:03,6,Kitchen Light"""
 
     def test_parse_csv_with_type_column(self):
         """Test parsing CSV with type column for CCO devices."""
-        csv_content = """device_type,address,relay,name,type
-CCO,02:06:03,6,Kitchen Light,switch
-CCO,02:06:04,1,Garage Door,cover
-CCO,02:06:05,2,Front Door,lock
-CCO,02:06:06,3,Thermostat,climate
-CCO,02:06:07,4,Bedroom Light,light"""
-
-        import csv
-        from io import StringIO
-
-        f = StringIO(csv_content)
-        reader = csv.DictReader(f)
-
         devices = []
-        for row in reader:
+        for row in _parse_csv(TYPED_CCO_CSV):
             device_type = row.get("device_type", "").strip().upper()
             if device_type in ("CCO", "SWITCH"):
                 button = int(row.get("relay", row.get("button", 1)))
@@ -658,18 +667,8 @@ CCO,02:06:07,4,Bedroom Light,light"""
 
     def test_parse_csv_dimmer(self):
         """Test parsing dimmers from CSV."""
-        csv_content = """device_type,address,name
-DIMMER,01:01:00:02:04,Living Room
-LIGHT,01:01:00:02:05,Dining Room"""
-
-        import csv
-        from io import StringIO
-
-        f = StringIO(csv_content)
-        reader = csv.DictReader(f)
-
         devices = []
-        for row in reader:
+        for row in _parse_csv(DIMMER_CSV):
             device_type = row.get("device_type", "").strip().upper()
             if device_type in ("LIGHT", "DIMMER"):
                 devices.append({
@@ -685,62 +684,30 @@ LIGHT,01:01:00:02:05,Dining Room"""
 
     def test_parse_csv_mixed_devices(self):
         """Test parsing mixed device types from CSV."""
-        csv_content = """device_type,address,relay,name,type
-CCO,02:06:03,6,Kitchen Light,switch
-DIMMER,01:01:00:02:04,,Living Room,
-COVER,02:06:04,1,Garage Door,
-LOCK,02:06:05,2,Front Door,
-CLIMATE,02:06:06,3,Thermostat,"""
-
-        import csv
-        from io import StringIO
-
-        f = StringIO(csv_content)
-        reader = csv.DictReader(f)
-
         cco_devices = []
         dimmers = []
 
-        for row in reader:
+        for row in _parse_csv(MIXED_DEVICES_CSV):
             device_type = row.get("device_type", "").strip().upper()
+            addr = normalize_address(row["address"].strip())
+            name = row.get("name", "").strip()
 
             if device_type in ("CCO", "SWITCH"):
-                button = int(row.get("relay", row.get("button", 1)))
                 cco_type = row.get("type", "").strip().lower() or "switch"
                 cco_devices.append({
-                    "address": normalize_address(row["address"].strip()),
-                    "button": button,
-                    "name": row.get("name", "").strip(),
+                    "address": addr,
+                    "button": int(row.get("relay", row.get("button", 1))),
+                    "name": name,
                     "entity_type": cco_type,
                 })
-            elif device_type in ("LIGHT", "DIMMER"):
-                dimmers.append({
-                    "address": normalize_address(row["address"].strip()),
-                    "name": row.get("name", "").strip(),
-                })
-            elif device_type == "COVER":
-                button = int(row.get("relay", row.get("button", 1)))
-                cco_devices.append({
-                    "address": normalize_address(row["address"].strip()),
-                    "button": button,
-                    "name": row.get("name", "").strip(),
-                    "entity_type": "cover",
-                })
-            elif device_type == "LOCK":
-                button = int(row.get("relay", row.get("button", 1)))
+            elif device_type in _DIMMER_TYPES:
+                dimmers.append({"address": addr, "name": name})
+            elif (entity_type := _DEVICE_TYPE_MAP.get(device_type)) is not None:
                 cco_devices.append({
-                    "address": normalize_address(row["address"].strip()),
-                    "button": button,
-                    "name": row.get("name", "").strip(),
-                    "entity_type": "lock",
-                })
-            elif device_type == "CLIMATE":
-                button = int(row.get("relay", row.get("button", 1)))
-                cco_devices.append({
-                    "address": normalize_address(row["address"].strip()),
-                    "button": button,
-                    "name": row.get("name", "").strip(),
-                    "entity_type": "climate",
+                    "address": addr,
+                    "button": int(row.get("relay", row.get("button", 1))),
+                    "name": name,
+                    "entity_type": entity_type,
                 })
 
         assert len(cco_devices) == 4
@@ -755,19 +722,8 @@ CLIMATE,02:06:06,3,Thermostat,"""
 
     def test_csv_address_normalization(self):
         """Test that addresses are normalized during CSV import."""
-        csv_content = """device_type,address,relay,name
-CCO,2:6:3,6,Test1
-CCO,[02:06:03],7,Test2
-CCO,02:06:03,8,Test3"""
-
-        import csv
-        from io import StringIO
-
-        f = StringIO(csv_content)
-        reader = csv.DictReader(f)
-
         addresses = []
-        for row in reader:
+        for row in _parse_csv(ADDRESS_FORMATS_CSV):
             addresses.append(normalize_address(row["address"].strip()))
 
         # All should normalize to the same format
@@ -775,49 +731,38 @@ CCO,02:06:03,8,Test3"""
         assert addresses[1] == "[02:06:03]"
         assert addresses[2] == "[02:06:03]"
 
-    def test_csv_duplicate_detection(self):
+    def test_csv_duplicate_detection(self, one_cco_options):
         """Test that duplicate devices are detected during CSV import."""
-        # Simulate existing options with a CCO device
-        existing_options = create_empty_options()
-        existing_options["cco_devices"].append({
-            "name": "Existing Light",
-            "addr": "[02:06:03]",
-            "button_number": 6,
-            "entity_type": "switch",
-            "inverted": False,
-        })
-
-        # CSV with same address/button should be detected as duplicate
-        csv_content = """device_type,address,relay,name,type
-CCO,02:06:03,6,Kitchen Light,switch
-CCO,02:06:03,7,Different Button,switch
-CCO,02:06:04,6,Different Address,switch"""
-
-        import csv
-        from io import StringIO
-
-        f = StringIO(csv_content)
-        reader = csv.DictReader(f)
+        # Existing options hold a CCO device at [02:06:03] button 6
+        existing_options = one_cco_options
+
+        # DUPLICATE_CCO_CSV repeats that address/button in its first row
+        existing_keys = {
+            (
+                normalize_address(device["addr"]),
+                device.get("button_number", device.get("relay_number", 1)),
+            )
+            for device in existing_options["cco_devices"]
+        }
 
         def is_duplicate_cco(addr: str, button: int) -> bool:
-            """Check if CCO device already exists."""
-            normalized = normalize_address(addr)
-            for device in existing_options["cco_devices"]:
-                existing_addr = normalize_address(device["addr"])
-                existing_button = device.get("button_number", device.get("relay_number", 1))
-                if existing_addr == normalized and existing_button == button:
-                    return True
-            return False
+            """Check if an already-normalized CCO address/button exists."""
+            return (addr, button) in existing_keys
+
+        # Resolve column positions once; rows are plain lists
+        header, *rows = _parse_csv(DUPLICATE_CCO_CSV, csv.reader)
+        cols = {name: i for i, name in enumerate(header)}
+        addr_i, relay_i, name_i = cols["address"], cols["relay"], cols["name"]
 
         duplicates = []
         new_devices = []
-        for row in reader:
-            button = int(row.get("relay", row.get("button", 1)))
-            addr = normalize_address(row["address"].strip())
+        for row in rows:
+            button = int(row[relay_i] or 1)
+            addr = normalize_address(row[addr_i].strip())
             if is_duplicate_cco(addr, button):
-                duplicates.append(row.get("name", ""))
+                duplicates.append(row[name_i])
             else:
-                new_devices.append(row.get("name", ""))
+                new_devices.append(row[name_i])
 
         # First one is duplicate (same address and button)
         assert "Kitchen Light" in duplicates
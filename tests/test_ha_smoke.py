@@ -12,262 +12,291 @@ Or in a HA dev container:
     pytest tests/test_ha_smoke.py -v
 """
 
+from importlib.util import find_spec
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
-# Mark all tests in this module as requiring HA
-pytestmark = [
-    pytest.mark.requires_ha,
-    pytest.mark.asyncio,
-]
+# Probe for HA without importing it so the module is dropped before any setup
+if find_spec("homeassistant") is None:
+    pytest.skip("Home Assistant not installed", allow_module_level=True)
+
+# Import errors in the integration itself must fail the module, not skip it
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+
+import custom_components.homeworks_hwi as homeworks_hwi  # noqa: E402
+from custom_components.homeworks_hwi import (  # noqa: E402
+    config_flow,
+    coordinator as coordinator_mod,
+    models,
+)
+
+# Mark all tests in this module as requiring HA; async tests run under
+# asyncio_mode = auto, so only tests that actually await are coroutines
+pytestmark = pytest.mark.requires_ha
 
 
 @pytest.fixture
 def mock_config_entry():
     """Create a mock config entry."""
-    try:
-        from homeassistant.config_entries import ConfigEntry
-        from unittest.mock import MagicMock, patch
-
-        entry = MagicMock(spec=ConfigEntry)
-        entry.entry_id = "test_entry_id"
-        entry.title = "Test Homeworks"
-        entry.domain = "homeworks"
-        entry.data = {
-            "host": "192.168.1.100",
-            "port": 23,
-            "username": None,
-            "password": None,
-        }
-        entry.options = {
-            "controller_id": "test_controller",
-            "cco_devices": [
-                {
-                    "name": "Test Switch",
-                    "addr": "[02:06:03]",
-                    "button_number": 6,
-                    "entity_type": "switch",
-                    "inverted": False,
-                }
-            ],
-            "dimmers": [],
-            "keypads": [],
-            "kls_poll_interval": 10,
-            "kls_window_offset": 9,
-            "ccos": [],
-            "covers": [],
-            "locks": [],
-        }
-        return entry
-    except ImportError:
-        pytest.skip("Home Assistant not installed")
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = "test_entry_id"
+    entry.title = "Test Homeworks"
+    entry.domain = homeworks_hwi.DOMAIN
+    entry.data = {
+        "host": "192.168.1.100",
+        "port": 23,
+        "username": None,
+        "password": None,
+    }
+    entry.options = {
+        "controller_id": "test_controller",
+        "cco_devices": [
+            {
+                "name": "Test Switch",
+                "addr": "[02:06:03]",
+                "button_number": 6,
+                "entity_type": "switch",
+                "inverted": False,
+            }
+        ],
+        "dimmers": [],
+        "keypads": [],
+        "kls_poll_interval": 10,
+        "kls_window_offset": 9,
+        "ccos": [],
+        "covers": [],
+        "locks": [],
+    }
+    return entry
+
+
+async def _async_return_true(*args, **kwargs) -> bool:
+    """Stand in for an awaited HA call whose calls are never asserted."""
+    return True
 
 
 @pytest.fixture
 def mock_hass():
     """Create a mock Home Assistant instance."""
-    try:
-        from unittest.mock import MagicMock, AsyncMock, patch
-
-        hass = MagicMock()
-        hass.data = {}
-        hass.config_entries = MagicMock()
-        hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=True)
-        hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
-        hass.bus = MagicMock()
-        hass.bus.async_listen_once = MagicMock(return_value=lambda: None)
-        return hass
-    except ImportError:
-        pytest.skip("Home Assistant not installed")
+    return SimpleNamespace(
+        data={},
+        config_entries=SimpleNamespace(
+            async_forward_entry_setups=_async_return_true,
+            async_unload_platforms=_async_return_true,
+        ),
+        bus=SimpleNamespace(async_listen_once=lambda *args: lambda: None),
+    )
 
 
 class TestIntegrationLoad:
     """Test that the integration loads correctly."""
 
-    async def test_import_integration(self):
+    def test_import_integration(self):
         """Test that the integration module can be imported."""
-        try:
-            from custom_components import homeworks
-            assert homeworks.DOMAIN == "homeworks"
-            assert hasattr(homeworks, "async_setup_entry")
-            assert hasattr(homeworks, "async_unload_entry")
-        except ImportError as e:
-            pytest.skip(f"Cannot import integration: {e}")
-
-    async def test_import_config_flow(self):
+        assert homeworks_hwi.DOMAIN == "homeworks_hwi"
+        assert hasattr(homeworks_hwi, "async_setup_entry")
+        assert hasattr(homeworks_hwi, "async_unload_entry")
+
+    def test_import_config_flow(self):
         """Test that config flow can be imported."""
-        try:
-            from custom_components.homeworks_hwi import config_flow
-            assert hasattr(config_flow, "HomeworksConfigFlowHandler")
-            assert config_flow.HomeworksConfigFlowHandler.domain == "homeworks"
-        except ImportError as e:
-            pytest.skip(f"Cannot import config_flow: {e}")
-
-    async def test_import_coordinator(self):
+        assert hasattr(config_flow, "HomeworksConfigFlowHandler")
+        assert config_flow.HomeworksConfigFlowHandler.domain == "homeworks_hwi"
+
+    def test_import_coordinator(self):
         """Test that coordinator can be imported."""
-        try:
-            from custom_components.homeworks_hwi.coordinator import HomeworksCoordinator
-            assert HomeworksCoordinator is not None
-        except ImportError as e:
-            pytest.skip(f"Cannot import coordinator: {e}")
+        assert coordinator_mod.HomeworksCoordinator is not None
 
 
+# Mock the coordinator class to avoid actual network calls
+@patch("custom_components.homeworks_hwi.HomeworksCoordinator", autospec=True)
 class TestConfigEntrySetup:
     """Test config entry setup and unload."""
 
-    async def test_setup_entry_creates_data(self, mock_hass, mock_config_entry):
+    def test_setup_entry_creates_data(
+        self, mock_coord_class, mock_hass, mock_config_entry
+    ):
         """Test that setup_entry creates the expected data structure."""
-        try:
-            from custom_components.homeworks_hwi import async_setup_entry, DOMAIN
-            from unittest.mock import AsyncMock, patch
-
-            # Mock the coordinator setup to avoid actual network calls
-            with patch("custom_components.homeworks_hwi.HomeworksCoordinator") as mock_coord_class:
-                mock_coordinator = AsyncMock()
-                mock_coordinator.async_setup = AsyncMock(return_value=True)
-                mock_coordinator.async_config_entry_first_refresh = AsyncMock()
-                mock_coordinator.async_shutdown = AsyncMock()
-                mock_coordinator.register_cco_device = lambda x: None
-                mock_coordinator.register_dimmer = lambda x: None
-                mock_coord_class.return_value = mock_coordinator
-
-                # This will fail without full HA but validates structure
-                # In a real HA environment, this would succeed
-                pytest.skip("Full setup requires HA environment")
-
-        except ImportError as e:
-            pytest.skip(f"Cannot import: {e}")
-
-    async def test_unload_entry_cleans_up(self, mock_hass, mock_config_entry):
+        mock_coordinator = AsyncMock()
+        mock_coordinator.async_setup = AsyncMock(return_value=True)
+        mock_coordinator.async_config_entry_first_refresh = AsyncMock()
+        mock_coordinator.async_shutdown = AsyncMock()
+        mock_coordinator.register_cco_device = lambda x: None
+        mock_coordinator.register_dimmer = lambda x: None
+        mock_coord_class.return_value = mock_coordinator
+
+        # This will fail without full HA but validates structure
+        # In a real HA environment, this would succeed
+        pytest.skip("Full setup requires HA environment")
+
+    async def test_unload_entry_cleans_up(
+        self, mock_coord_class, mock_hass, mock_config_entry
+    ):
         """Test that unload_entry properly cleans up."""
-        try:
-            from custom_components.homeworks_hwi import async_unload_entry, DOMAIN, HomeworksData
-            from unittest.mock import AsyncMock
-
-            # Set up mock data
-            mock_coordinator = AsyncMock()
-            mock_coordinator.async_shutdown = AsyncMock()
-
-            mock_hass.data[DOMAIN] = {
-                mock_config_entry.entry_id: HomeworksData(
-                    coordinator=mock_coordinator,
-                    controller_id="test",
-                )
-            }
+        # Set up mock data
+        mock_coordinator = AsyncMock()
+        mock_coordinator.async_shutdown = AsyncMock()
+
+        mock_hass.data[homeworks_hwi.DOMAIN] = {
+            mock_config_entry.entry_id: homeworks_hwi.HomeworksData(
+                coordinator=mock_coordinator,
+                controller_id="test",
+            )
+        }
+
+        result = await homeworks_hwi.async_unload_entry(mock_hass, mock_config_entry)
 
-            result = await async_unload_entry(mock_hass, mock_config_entry)
+        assert result is True
+        mock_coordinator.async_shutdown.assert_called_once()
+        assert mock_config_entry.entry_id not in mock_hass.data[homeworks_hwi.DOMAIN]
 
-            assert result is True
-            mock_coordinator.async_shutdown.assert_called_once()
-            assert mock_config_entry.entry_id not in mock_hass.data[DOMAIN]
 
-        except ImportError as e:
-            pytest.skip(f"Cannot import: {e}")
+@pytest.fixture(scope="class")
+def class_mock_hass():
+    """Create a stub hass shared by every test in a class."""
+    return SimpleNamespace(async_create_task=lambda x: None)
+
+
+@pytest.fixture(scope="class")
+def class_set_updated_data():
+    """Create the async_set_updated_data mock shared by a class."""
+    return MagicMock()
+
+
+@pytest.fixture
+def kls_coordinator(class_mock_hass, class_set_updated_data):
+    """Return a coordinator skeleton ready to process KLS updates.
+
+    Built with __new__ so __init__ never runs; only the cheap state
+    containers are fresh per test, the mocks are reset instead.
+    """
+    class_set_updated_data.reset_mock()
+
+    HomeworksCoordinator = coordinator_mod.HomeworksCoordinator
+    coordinator = HomeworksCoordinator.__new__(HomeworksCoordinator)
+    coordinator.hass = class_mock_hass
+    coordinator._cco_devices = {}
+    coordinator._cco_states = {}
+    coordinator._kls_cco_devices = {}
+    coordinator._kls_poll_addresses = set()
+    coordinator._kls_initial_requests = set()
+    coordinator._keypad_led_states = {}
+    coordinator._kls_window_offset = 9
+    coordinator._client = None
+    coordinator.async_set_updated_data = class_set_updated_data
+    return coordinator
 
 
 class TestCoordinatorKLSProcessing:
     """Test that coordinator processes KLS lines correctly."""
 
-    async def test_kls_state_update(self):
+    def test_kls_state_update(self, kls_coordinator):
         """Test that KLS updates trigger state changes."""
-        try:
-            from custom_components.homeworks_hwi.coordinator import HomeworksCoordinator
-            from custom_components.homeworks_hwi.client import HomeworksClientConfig
-            from custom_components.homeworks_hwi.models import CCOAddress, CCODevice, CCOEntityType
-            from unittest.mock import MagicMock, AsyncMock, patch
-
-            # Create a mock hass
-            mock_hass = MagicMock()
-            mock_hass.async_create_task = lambda x: None
-
-            # Create coordinator with mock config
-            config = HomeworksClientConfig(host="127.0.0.1", port=23)
-
-            with patch.object(HomeworksCoordinator, "__init__", lambda self, **kwargs: None):
-                coordinator = HomeworksCoordinator.__new__(HomeworksCoordinator)
-                coordinator.hass = mock_hass
-                coordinator._cco_devices = {}
-                coordinator._cco_states = {}
-                coordinator._keypad_led_states = {}
-                coordinator._kls_window_offset = 9
-                coordinator._client = None
-                coordinator.async_set_updated_data = MagicMock()
-
-                # Register a CCO device
-                address = CCOAddress(processor=2, link=6, address=3, button=6)
-                device = CCODevice(
-                    address=address,
-                    name="Test",
-                    entity_type=CCOEntityType.SWITCH,
-                    inverted=False,
-                )
-                coordinator._cco_devices[address.unique_key] = device
-                coordinator._cco_states[address.unique_key] = False
-
-                # Simulate KLS update with button 6 ON
-                # Button 6 is at index 9 + 5 = 14
-                # String: 000000000222111110000000
-                led_states = [0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0]
-                coordinator._handle_kls_update("[02:06:03]", led_states)
-
-                # Button 6 should now be ON (index 14 = 1)
-                assert coordinator._cco_states[address.unique_key] is True
-
-                # Simulate KLS update with button 6 OFF
-                led_states = [0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 1, 1, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0]
-                coordinator._handle_kls_update("[02:06:03]", led_states)
-
-                # Button 6 should now be OFF (index 14 = 2)
-                assert coordinator._cco_states[address.unique_key] is False
-
-        except ImportError as e:
-            pytest.skip(f"Cannot import: {e}")
-
-    async def test_configurable_window_offset(self):
+        coordinator = kls_coordinator
+
+        # Register a CCO device
+        address = models.CCOAddress(processor=2, link=6, address=3, button=6)
+        device = models.CCODevice(
+            address=address,
+            name="Test",
+            entity_type=models.CCOEntityType.SWITCH,
+            inverted=False,
+        )
+        coordinator.register_cco_device(device)
+
+        # Simulate KLS update with button 6 ON
+        # Button 6 is at index 9 + 5 = 14
+        # String: 000000000222111110000000
+        led_states = [0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0]
+        coordinator._handle_kls_update("[02:06:03]", led_states)
+
+        # Button 6 should now be ON (index 14 = 1)
+        assert coordinator._cco_states[address.unique_key] is True
+
+        # Simulate KLS update with button 6 OFF
+        led_states = [0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 1, 1, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0]
+        coordinator._handle_kls_update("[02:06:03]", led_states)
+
+        # Button 6 should now be OFF (index 14 = 2)
+        assert coordinator._cco_states[address.unique_key] is False
+
+    def test_configurable_window_offset(self, kls_coordinator):
         """Test that window offset is configurable."""
-        try:
-            from custom_components.homeworks_hwi.coordinator import HomeworksCoordinator
-            from custom_components.homeworks_hwi.models import CCOAddress, CCODevice, CCOEntityType
-            from unittest.mock import MagicMock, patch
-
-            mock_hass = MagicMock()
-            mock_hass.async_create_task = lambda x: None
-
-            with patch.object(HomeworksCoordinator, "__init__", lambda self, **kwargs: None):
-                coordinator = HomeworksCoordinator.__new__(HomeworksCoordinator)
-                coordinator.hass = mock_hass
-                coordinator._cco_devices = {}
-                coordinator._cco_states = {}
-                coordinator._keypad_led_states = {}
-                coordinator._kls_window_offset = 8  # Different offset
-                coordinator._client = None
-                coordinator.async_set_updated_data = MagicMock()
-
-                # Register a CCO device
-                address = CCOAddress(processor=2, link=6, address=3, button=1)
-                device = CCODevice(
-                    address=address,
-                    name="Test",
-                    entity_type=CCOEntityType.SWITCH,
-                    inverted=False,
-                )
-                coordinator._cco_devices[address.unique_key] = device
-                coordinator._cco_states[address.unique_key] = False
-
-                # With offset 8, button 1 is at index 8
-                # Set index 8 to 1 (ON)
-                led_states = [0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0]
-                coordinator._handle_kls_update("[02:06:03]", led_states)
-
-                assert coordinator._cco_states[address.unique_key] is True
-
-        except ImportError as e:
-            pytest.skip(f"Cannot import: {e}")
+        coordinator = kls_coordinator
+        coordinator._kls_window_offset = 8  # Different offset
+
+        # Register a CCO device
+        address = models.CCOAddress(processor=2, link=6, address=3, button=1)
+        device = models.CCODevice(
+            address=address,
+            name="Test",
+            entity_type=models.CCOEntityType.SWITCH,
+            inverted=False,
+        )
+        coordinator.register_cco_device(device)
+
+        # With offset 8, button 1 is at index 8
+        # Set index 8 to 1 (ON)
+        led_states = [0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0]
+        coordinator._handle_kls_update("[02:06:03]", led_states)
+
+        assert coordinator._cco_states[address.unique_key] is True
+
+
+class TestInitialKLSRequest:
+    """Test the once-per-keypad initial KLS request."""
+
+    async def test_unsent_request_is_retried(self, kls_coordinator):
+        """A request made before the client exists does not block later ones."""
+        coordinator = kls_coordinator
+
+        assert await coordinator.async_request_initial_keypad_led_states("2:6:3") is False
+        assert "[02:06:03]" not in coordinator._kls_initial_requests
+
+        coordinator._client = AsyncMock()
+        coordinator._client.request_keypad_led_states.return_value = True
+        assert await coordinator.async_request_initial_keypad_led_states("2:6:3") is True
+        assert await coordinator.async_request_initial_keypad_led_states("2:6:3") is True
+
+        coordinator._client.request_keypad_led_states.assert_awaited_once_with(
+            "[02:06:03]"
+        )
+
+
+class TestCSVImport:
+    """Test the CSV import path of the options flow."""
+
+    @pytest.mark.parametrize(
+        ("row", "expected"),
+        [
+            ({"relay": "6", "button": "2"}, 6),
+            ({"relay": "", "button": "2"}, 2),
+            ({"relay": ""}, 1),
+            ({"button": "3"}, 3),
+            ({}, 1),
+        ],
+    )
+    def test_row_button(self, row, expected):
+        """A blank or missing relay column falls back to button, then 1."""
+        assert config_flow._row_button(row) == expected
+
+    async def test_blank_relay_uses_button_column(self):
+        """A CSV row with an empty relay cell imports with its button number."""
+        handler = SimpleNamespace(flow_state={})
+        csv_file = "device_type,address,relay,button,name\nCCO,02:06:03,,4,Porch\n"
+
+        await config_flow.async_parse_csv(handler, {"csv_file": csv_file})
+
+        (device,) = handler.flow_state["import_devices"]
+        assert device.address == "[02:06:03]"
+        assert device.button == 4
 
 
 class TestCredentialStorage:
     """Test that credentials are stored correctly."""
 
-    async def test_credentials_in_data_not_options(self):
+    def test_credentials_in_data_not_options(self):
         """Verify credentials are stored in entry.data, not entry.options."""
         # This is a documentation/validation test
         expected_data_keys = {"host", "port", "username", "password"}
@@ -298,22 +327,14 @@ class TestNoDuplicatePolling:
 
     async def test_shutdown_cancels_polling(self):
         """Test that shutdown properly stops polling."""
-        try:
-            from custom_components.homeworks_hwi.coordinator import HomeworksCoordinator
-            from custom_components.homeworks_hwi.client import HomeworksClient
-            from unittest.mock import MagicMock, AsyncMock, patch
-
-            with patch.object(HomeworksCoordinator, "__init__", lambda self, **kwargs: None):
-                coordinator = HomeworksCoordinator.__new__(HomeworksCoordinator)
-
-                mock_client = AsyncMock()
-                mock_client.stop = AsyncMock()
-                coordinator._client = mock_client
+        HomeworksCoordinator = coordinator_mod.HomeworksCoordinator
+        coordinator = HomeworksCoordinator.__new__(HomeworksCoordinator)
 
-                await coordinator.async_shutdown()
+        mock_client = AsyncMock()
+        mock_client.stop = AsyncMock()
+        coordinator._client = mock_client
 
-                mock_client.stop.assert_called_once()
-                assert coordinator._client is None
+        await coordinator.async_shutdown()
 
-        except ImportError as e:
-            pytest.skip(f"Cannot import: {e}")
+        mock_client.stop.assert_called_once()
+        assert coordinator._client is None
@@ -13,7 +13,7 @@ Digit semantics:
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from models import (
     KLSState,
@@ -22,7 +22,22 @@ from models import (
     CCOEntityType,
     CCO_BUTTON_WINDOW_OFFSET,
 )
-from pyhomeworks import KLSMessage, MessageParser
+from pyhomeworks import KLSMessage
+
+from kls_samples import (
+    FIXED_TS,
+    SAMPLE1_BYTES,
+    SAMPLE1_LEDS,
+    SAMPLE2_BYTES,
+    SAMPLE2_LEDS,
+)
+
+
+def _leds(window_digit: int, offset: int = CCO_BUTTON_WINDOW_OFFSET) -> list[int]:
+    """Build 24 LED states, zero except for one digit across the button window."""
+    states = bytearray(24)
+    states[offset : offset + 8] = bytes((window_digit,)) * 8
+    return list(states)
 
 
 class TestButtonWindowExtraction:
@@ -53,9 +68,8 @@ class TestSampleKLSLines:
         KLS, [02:06:03], 000000000222112110000000
         Button 6 = index 14 = digit '2' = OFF
         """
-        kls_string = "000000000222112110000000"
-        led_states = [int(c) for c in kls_string]
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
+        led_states = list(SAMPLE1_LEDS)
+        kls = KLSState(address="[02:06:03]", led_states=led_states, timestamp=FIXED_TS)
 
         # Verify raw digit
         assert led_states[14] == 2
@@ -68,9 +82,8 @@ class TestSampleKLSLines:
         KLS, [02:06:03], 000000000222111110000000
         Button 6 = index 14 = digit '1' = ON
         """
-        kls_string = "000000000222111110000000"
-        led_states = [int(c) for c in kls_string]
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
+        led_states = list(SAMPLE2_LEDS)
+        kls = KLSState(address="[02:06:03]", led_states=led_states, timestamp=FIXED_TS)
 
         # Verify raw digit
         assert led_states[14] == 1
@@ -78,55 +91,28 @@ class TestSampleKLSLines:
         # Verify interpreted state
         assert kls.get_cco_state(6) is True
 
-    def test_sample_1_all_buttons(self):
-        """
-        Window: 22211211
-        Button states: OFF, OFF, OFF, ON, ON, OFF, ON, ON
-        """
-        kls_string = "000000000222112110000000"
-        led_states = [int(c) for c in kls_string]
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
-
-        expected = {
-            1: False,  # index 9, digit 2
-            2: False,  # index 10, digit 2
-            3: False,  # index 11, digit 2
-            4: True,   # index 12, digit 1
-            5: True,   # index 13, digit 1
-            6: False,  # index 14, digit 2
-            7: True,   # index 15, digit 1
-            8: True,   # index 16, digit 1
-        }
-
-        for button, expected_state in expected.items():
-            actual = kls.get_cco_state(button)
-            assert actual == expected_state, \
-                f"Button {button}: expected {expected_state}, got {actual}"
-
-    def test_sample_2_all_buttons(self):
-        """
-        Window: 22211111
-        Button states: OFF, OFF, OFF, ON, ON, ON, ON, ON
-        """
-        kls_string = "000000000222111110000000"
-        led_states = [int(c) for c in kls_string]
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
-
-        expected = {
-            1: False, 2: False, 3: False, 4: True,
-            5: True, 6: True, 7: True, 8: True,
-        }
-
-        for button, expected_state in expected.items():
-            assert kls.get_cco_state(button) == expected_state
+    @pytest.mark.parametrize(
+        ("leds", "button", "expected"),
+        [
+            # Sample 1 window: 22211211 -> OFF, OFF, OFF, ON, ON, OFF, ON, ON
+            *zip([SAMPLE1_LEDS] * 8, range(1, 9),
+                 [False, False, False, True, True, False, True, True]),
+            # Sample 2 window: 22211111 -> OFF, OFF, OFF, ON, ON, ON, ON, ON
+            *zip([SAMPLE2_LEDS] * 8, range(1, 9),
+                 [False, False, False, True, True, True, True, True]),
+        ],
+    )
+    def test_button(self, leds, button, expected):
+        """Check each button of both sample windows."""
+        kls = KLSState(address="[02:06:03]", led_states=list(leds), timestamp=FIXED_TS)
+        assert kls.get_cco_state(button) == expected
 
 
 class TestMessageParserKLS:
     """Test KLS parsing through MessageParser."""
 
-    def test_parse_sample_1(self):
-        parser = MessageParser()
-        data = b"KLS, [02:06:03], 000000000222112110000000\r\n"
+    def test_parse_sample_1(self, parser):
+        data = SAMPLE1_BYTES
         messages = parser.feed(data)
 
         assert len(messages) == 1
@@ -134,9 +120,8 @@ class TestMessageParserKLS:
         assert isinstance(msg, KLSMessage)
         assert msg.get_cco_relay_state(6) is False
 
-    def test_parse_sample_2(self):
-        parser = MessageParser()
-        data = b"KLS, [02:06:03], 000000000222111110000000\r\n"
+    def test_parse_sample_2(self, parser):
+        data = SAMPLE2_BYTES
         messages = parser.feed(data)
 
         msg = messages[0]
@@ -146,71 +131,51 @@ class TestMessageParserKLS:
 class TestCCODeviceInterpretation:
     """Test CCODevice state interpretation with button window."""
 
-    def test_normal_device_sample_1(self):
+    @pytest.mark.parametrize(
+        ("inverted", "digit", "expected"),
+        [
+            (False, 2, False),  # Sample 1: button 6 digit = 2
+            (False, 1, True),   # Sample 2: button 6 digit = 1
+            (True, 2, True),    # Sample 1, inverted = ON
+            (True, 1, False),   # Sample 2, inverted = OFF
+        ],
+    )
+    def test_interpret_state(self, inverted, digit, expected):
         device = CCODevice(
             address=CCOAddress(2, 6, 3, 6),
             name="Test",
             entity_type=CCOEntityType.SWITCH,
-            inverted=False,
+            inverted=inverted,
         )
-
-        # Sample 1: button 6 digit = 2
-        assert device.interpret_state(2) is False
-
-    def test_normal_device_sample_2(self):
-        device = CCODevice(
-            address=CCOAddress(2, 6, 3, 6),
-            name="Test",
-            entity_type=CCOEntityType.SWITCH,
-            inverted=False,
-        )
-
-        # Sample 2: button 6 digit = 1
-        assert device.interpret_state(1) is True
-
-    def test_inverted_device_sample_1(self):
-        device = CCODevice(
-            address=CCOAddress(2, 6, 3, 6),
-            name="Inverted",
-            entity_type=CCOEntityType.SWITCH,
-            inverted=True,
-        )
-
-        # Sample 1: button 6 digit = 2, inverted = ON
-        assert device.interpret_state(2) is True
-
-    def test_inverted_device_sample_2(self):
-        device = CCODevice(
-            address=CCOAddress(2, 6, 3, 6),
-            name="Inverted",
-            entity_type=CCOEntityType.SWITCH,
-            inverted=True,
-        )
-
-        # Sample 2: button 6 digit = 1, inverted = OFF
-        assert device.interpret_state(1) is False
+        assert device.interpret_state(digit) is expected
 
 
 class TestPartialFrames:
     """Test partial/combined RS232 frame handling."""
 
-    def test_fragmented_kls(self):
-        parser = MessageParser()
-
-        # Send in fragments
-        assert len(parser.feed(b"KLS, [02:06")) == 0
-        assert len(parser.feed(b":03], 000000")) == 0
-        messages = parser.feed(b"000222112110000000\r\n")
+    @pytest.mark.parametrize(
+        "splits",
+        [
+            (11, 23),  # b"KLS, [02:06", b":03], 000000", then the rest
+            (5, 10, 20),
+            (1, 2, 3, 4, 5),
+            (40,),
+            (42,),  # between CR and LF
+        ],
+    )
+    def test_fragmented_kls(self, parser, splits):
+        # Only the final fragment may complete a message
+        start = 0
+        for end in splits:
+            assert parser.feed(SAMPLE1_BYTES[start:end]) == []
+            start = end
+        messages = parser.feed(SAMPLE1_BYTES[start:])
 
         assert len(messages) == 1
         assert messages[0].get_cco_relay_state(6) is False
 
-    def test_combined_messages(self):
-        parser = MessageParser()
-        data = (
-            b"KLS, [02:06:03], 000000000222112110000000\r\n"
-            b"KLS, [02:06:03], 000000000222111110000000\r\n"
-        )
+    def test_combined_messages(self, parser):
+        data = SAMPLE1_BYTES + SAMPLE2_BYTES
         messages = parser.feed(data)
 
         assert len(messages) == 2
@@ -222,27 +187,27 @@ class TestEdgeCases:
     """Edge case tests."""
 
     def test_button_0_returns_false(self):
-        kls = KLSState(address="[02:06:03]", led_states=[1] * 24)
+        kls = KLSState(address="[02:06:03]", led_states=[1] * 24, timestamp=FIXED_TS)
         assert kls.get_cco_state(0) is False
 
     def test_button_9_returns_false(self):
-        kls = KLSState(address="[02:06:03]", led_states=[1] * 24)
+        kls = KLSState(address="[02:06:03]", led_states=[1] * 24, timestamp=FIXED_TS)
         assert kls.get_cco_state(9) is False
 
     def test_all_zeros_means_off(self):
-        kls = KLSState(address="[02:06:03]", led_states=[0] * 24)
+        kls = KLSState(address="[02:06:03]", led_states=_leds(0), timestamp=FIXED_TS)
         for button in range(1, 9):
             assert kls.get_cco_state(button) is False
 
     def test_window_all_ones_means_on(self):
-        led_states = [0] * 9 + [1] * 8 + [0] * 7
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
+        led_states = _leds(1)
+        kls = KLSState(address="[02:06:03]", led_states=led_states, timestamp=FIXED_TS)
         for button in range(1, 9):
             assert kls.get_cco_state(button) is True
 
     def test_digit_3_flash2_means_off(self):
-        led_states = [0] * 9 + [3] * 8 + [0] * 7
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
+        led_states = _leds(3)
+        kls = KLSState(address="[02:06:03]", led_states=led_states, timestamp=FIXED_TS)
         for button in range(1, 9):
             assert kls.get_cco_state(button) is False
 
@@ -250,7 +215,7 @@ class TestEdgeCases:
         kls = KLSState(
             address="[02:06:03]",
             led_states=[0] * 24,
-            timestamp=datetime.now() - timedelta(minutes=5),
+            timestamp=FIXED_TS - timedelta(minutes=5),
         )
-        age = datetime.now() - kls.timestamp
+        age = FIXED_TS - kls.timestamp
         assert age > timedelta(minutes=1)
@@ -18,54 +18,43 @@ from models import (
     parse_kls_address,
 )
 
+from kls_samples import FIXED_TS, SAMPLE1_LEDS, SAMPLE2_LEDS
+
 
 class TestNormalizeAddress:
     """Tests for address normalization."""
 
-    def test_simple_address(self):
-        assert normalize_address("1:2:3") == "[01:02:03]"
-
-    def test_address_with_brackets(self):
-        assert normalize_address("[1:2:3]") == "[01:02:03]"
-
-    def test_already_normalized(self):
-        assert normalize_address("[01:02:03]") == "[01:02:03]"
-
-    def test_4_part_address(self):
-        assert normalize_address("1:2:3:4") == "[01:02:03:04]"
-
-    def test_5_part_address(self):
-        assert normalize_address("1:2:3:4:5") == "[01:02:03:04:05]"
+    @pytest.mark.parametrize(
+        ("address", "expected"),
+        [
+            ("1:2:3", "[01:02:03]"),
+            ("[1:2:3]", "[01:02:03]"),
+            ("[01:02:03]", "[01:02:03]"),
+            ("1:2:3:4", "[01:02:03:04]"),
+            ("1:2:3:4:5", "[01:02:03:04:05]"),
+        ],
+    )
+    def test_normalize_address(self, address, expected):
+        assert normalize_address(address) == expected
 
 
 class TestCCOAddress:
     """Tests for CCOAddress parsing."""
 
-    def test_from_string_comma_format(self):
-        addr = CCOAddress.from_string("2:6:3,6")
-        assert addr.processor == 2
-        assert addr.link == 6
-        assert addr.address == 3
-        assert addr.button == 6
-
-    def test_from_string_bracketed(self):
-        addr = CCOAddress.from_string("[02:06:03],6")
-        assert addr.processor == 2
-        assert addr.link == 6
-        assert addr.address == 3
-        assert addr.button == 6
-
-    def test_from_string_colon_format(self):
-        addr = CCOAddress.from_string("2:6:3:6")
-        assert addr.processor == 2
-        assert addr.link == 6
-        assert addr.address == 3
-        assert addr.button == 6
+    @pytest.mark.parametrize("address", ["2:6:3,6", "[02:06:03],6", "2:6:3:6"])
+    def test_from_string(self, address):
+        addr = CCOAddress.from_string(address)
+        assert (addr.processor, addr.link, addr.address, addr.button) == (2, 6, 3, 6)
 
     def test_to_kls_address(self):
         addr = CCOAddress(processor=2, link=6, address=3, button=6)
         assert addr.to_kls_address() == "[02:06:03]"
 
+    def test_to_kls_address_is_interned(self):
+        first = CCOAddress(processor=2, link=6, address=3, button=6)
+        second = CCOAddress(processor=2, link=6, address=3, button=7)
+        assert first.to_kls_address() is second.to_kls_address()
+
     def test_to_command_address(self):
         addr = CCOAddress(processor=2, link=6, address=3, button=6)
         assert addr.to_command_address() == "[2:6:3]"
@@ -85,43 +74,43 @@ class TestCCOAddress:
             CCOAddress.from_string("1:2")
 
 
+@pytest.fixture(scope="class")
+def device():
+    """Return a normal CCO switch; tests only read it."""
+    return CCODevice(
+        address=CCOAddress(2, 6, 3, 6),
+        name="Test",
+        entity_type=CCOEntityType.SWITCH,
+    )
+
+
+@pytest.fixture(scope="class")
+def inverted_device():
+    """Return an inverted CCO switch; tests only read it."""
+    return CCODevice(
+        address=CCOAddress(2, 6, 3, 6),
+        name="Test",
+        entity_type=CCOEntityType.SWITCH,
+        inverted=True,
+    )
+
+
 class TestCCODevice:
     """Tests for CCODevice."""
 
-    def test_interpret_state_on(self):
-        device = CCODevice(
-            address=CCOAddress(2, 6, 3, 6),
-            name="Test",
-            entity_type=CCOEntityType.SWITCH,
-        )
+    def test_interpret_state_on(self, device):
         assert device.interpret_state(1) is True
 
-    def test_interpret_state_off(self):
-        device = CCODevice(
-            address=CCOAddress(2, 6, 3, 6),
-            name="Test",
-            entity_type=CCOEntityType.SWITCH,
-        )
+    def test_interpret_state_off(self, device):
         assert device.interpret_state(2) is False
 
-    def test_interpret_state_zero(self):
-        device = CCODevice(
-            address=CCOAddress(2, 6, 3, 6),
-            name="Test",
-            entity_type=CCOEntityType.SWITCH,
-        )
+    def test_interpret_state_zero(self, device):
         assert device.interpret_state(0) is False
 
-    def test_interpret_state_inverted(self):
-        device = CCODevice(
-            address=CCOAddress(2, 6, 3, 6),
-            name="Test",
-            entity_type=CCOEntityType.SWITCH,
-            inverted=True,
-        )
+    def test_interpret_state_inverted(self, inverted_device):
         # Inverted: digit 1 = OFF, digit 2 = ON
-        assert device.interpret_state(1) is False
-        assert device.interpret_state(2) is True
+        assert inverted_device.interpret_state(1) is False
+        assert inverted_device.interpret_state(2) is True
 
     def test_unique_id(self):
         device = CCODevice(
@@ -140,20 +129,20 @@ class TestKLSState:
 
     def test_get_cco_state_sample_1(self):
         """Button 6 should be OFF in sample 1."""
-        led_states = [int(c) for c in "000000000222112110000000"]
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
+        led_states = list(SAMPLE1_LEDS)
+        kls = KLSState(address="[02:06:03]", led_states=led_states, timestamp=FIXED_TS)
         assert kls.get_cco_state(6) is False
 
     def test_get_cco_state_sample_2(self):
         """Button 6 should be ON in sample 2."""
-        led_states = [int(c) for c in "000000000222111110000000"]
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
+        led_states = list(SAMPLE2_LEDS)
+        kls = KLSState(address="[02:06:03]", led_states=led_states, timestamp=FIXED_TS)
         assert kls.get_cco_state(6) is True
 
     def test_all_buttons_sample_1(self):
         """Test all 8 buttons with sample 1."""
-        led_states = [int(c) for c in "000000000222112110000000"]
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
+        led_states = list(SAMPLE1_LEDS)
+        kls = KLSState(address="[02:06:03]", led_states=led_states, timestamp=FIXED_TS)
 
         expected = {1: False, 2: False, 3: False, 4: True,
                     5: True, 6: False, 7: True, 8: True}
@@ -164,7 +153,7 @@ class TestKLSState:
     def test_get_button_state_raw(self):
         """Test raw LED state access (1-indexed position)."""
         led_states = [1, 2, 3] + [0] * 21
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
+        kls = KLSState(address="[02:06:03]", led_states=led_states, timestamp=FIXED_TS)
 
         assert kls.get_button_state(1) == 1
         assert kls.get_button_state(2) == 2
@@ -172,7 +161,7 @@ class TestKLSState:
 
     def test_button_out_of_range(self):
         led_states = [1] * 24
-        kls = KLSState(address="[02:06:03]", led_states=led_states)
+        kls = KLSState(address="[02:06:03]", led_states=led_states, timestamp=FIXED_TS)
 
         assert kls.get_cco_state(0) is False
         assert kls.get_cco_state(9) is False
@@ -185,13 +174,9 @@ class TestKLSState:
 class TestParseKLSAddress:
     """Tests for KLS address parsing."""
 
-    def test_parse_simple(self):
-        proc, link, addr = parse_kls_address("[02:06:03]")
-        assert (proc, link, addr) == (2, 6, 3)
-
-    def test_parse_no_brackets(self):
-        proc, link, addr = parse_kls_address("02:06:03")
-        assert (proc, link, addr) == (2, 6, 3)
+    @pytest.mark.parametrize("address", ["[02:06:03]", "02:06:03"])
+    def test_parse(self, address):
+        assert parse_kls_address(address) == (2, 6, 3)
 
     def test_parse_invalid(self):
         with pytest.raises(ValueError):
@@ -201,31 +186,25 @@ class TestParseKLSAddress:
 class TestControllerHealth:
     """Tests for ControllerHealth tracking."""
 
-    def test_initial_state(self):
+    def test_health_lifecycle(self):
+        """Drive one ControllerHealth through every recorded transition."""
         health = ControllerHealth()
         assert health.connected is False
         assert health.reconnect_count == 0
         assert health.poll_failure_count == 0
 
-    def test_record_message(self):
-        health = ControllerHealth()
         health.record_message()
         assert health.last_message_time is not None
+        assert health.last_kls_time is None
 
-    def test_record_kls(self):
-        health = ControllerHealth()
         health.record_kls()
         assert health.last_kls_time is not None
-        assert health.last_message_time is not None
+        assert health.last_message_time == health.last_kls_time
 
-    def test_record_reconnect(self):
-        health = ControllerHealth()
         health.record_reconnect()
         health.record_reconnect()
         assert health.reconnect_count == 2
 
-    def test_record_errors(self):
-        health = ControllerHealth()
         health.record_poll_failure("timeout")
         assert health.poll_failure_count == 1
         assert health.last_error == "timeout"
@@ -3,6 +3,8 @@
 These tests run WITHOUT Home Assistant dependencies.
 """
 
+from typing import Callable
+
 import pytest
 
 # Direct imports from pyhomeworks package (no HA deps)
@@ -21,6 +23,32 @@ from pyhomeworks import (
 )
 from pyhomeworks import commands
 
+from kls_samples import SAMPLE1_BYTES, SAMPLE2_BYTES
+
+# Dimmer level frame shared by several tests
+_DL_FRAME = b"DL, [01:01:00:02:04], 75\r\n"
+
+# Expected (button, relay state) pairs for each sample's button window
+_SAMPLE1_EXPECTED: tuple[tuple[int, bool], ...] = (  # Window: 22211211
+    (1, False), (2, False), (3, False), (4, True),
+    (5, True), (6, False), (7, True), (8, True),
+)
+_SAMPLE2_EXPECTED: tuple[tuple[int, bool], ...] = (  # Window: 22211111
+    (1, False), (2, False), (3, False), (4, True),
+    (5, True), (6, True), (7, True), (8, True),
+)
+_BUTTON_FRAMES: list[tuple[bytes, ButtonEventType, str]] = [
+    (f"{cmd}, [01:02:03], 5\r\n".encode(), event_type, source)
+    for cmd, event_type, source in [
+        ("KBP", ButtonEventType.PRESSED, "keypad"),
+        ("KBR", ButtonEventType.RELEASED, "keypad"),
+        ("KBH", ButtonEventType.HOLD, "keypad"),
+        ("KBDT", ButtonEventType.DOUBLE_TAP, "keypad"),
+        ("DBP", ButtonEventType.PRESSED, "dimmer"),
+        ("SVBP", ButtonEventType.PRESSED, "sivoia"),
+    ]
+]
+
 
 class TestNormalizeAddress:
     """Tests for address normalization."""
@@ -57,9 +85,8 @@ class TestParseAddress:
 class TestMessageParser:
     """Tests for MessageParser class."""
 
-    def test_parse_kls_message(self):
-        parser = MessageParser()
-        data = b"KLS, [02:06:03], 000000000222112110000000\r\n"
+    def test_parse_kls_message(self, parser):
+        data = SAMPLE1_BYTES
         messages = parser.feed(data)
 
         assert len(messages) == 1
@@ -68,9 +95,8 @@ class TestMessageParser:
         assert msg.address == "[02:06:03]"
         assert len(msg.led_states) == 24
 
-    def test_parse_dl_message(self):
-        parser = MessageParser()
-        data = b"DL, [01:01:00:02:04], 75\r\n"
+    def test_parse_dl_message(self, parser):
+        data = _DL_FRAME
         messages = parser.feed(data)
 
         assert len(messages) == 1
@@ -79,31 +105,34 @@ class TestMessageParser:
         assert msg.address == "[01:01:00:02:04]"
         assert msg.level == 75
 
-    def test_parse_button_events(self):
-        parser = MessageParser()
-
-        for cmd, event_type, source in [
-            ("KBP", ButtonEventType.PRESSED, "keypad"),
-            ("KBR", ButtonEventType.RELEASED, "keypad"),
-            ("KBH", ButtonEventType.HOLD, "keypad"),
-            ("KBDT", ButtonEventType.DOUBLE_TAP, "keypad"),
-            ("DBP", ButtonEventType.PRESSED, "dimmer"),
-            ("SVBP", ButtonEventType.PRESSED, "sivoia"),
-        ]:
-            parser.reset()
-            data = f"{cmd}, [01:02:03], 5\r\n".encode()
-            messages = parser.feed(data)
-
-            assert len(messages) == 1
-            msg = messages[0]
-            assert isinstance(msg, ButtonEventMessage)
-            assert msg.event_type == event_type
-            assert msg.source == source
-            assert msg.button == 5
-
-    def test_parse_kes_message(self):
-        parser = MessageParser()
+    def test_parse_padded_separators(self, parser):
+        data = b"DL ,  [01:01:00:02:04],  75\r\n"
+        messages = parser.feed(data)
 
+        assert len(messages) == 1
+        msg = messages[0]
+        assert isinstance(msg, DimmerLevelMessage)
+        assert msg.address == "[01:01:00:02:04]"
+        assert msg.level == 75
+
+    @pytest.mark.parametrize(("data", "event_type", "source"), _BUTTON_FRAMES)
+    def test_parse_button_events(
+        self,
+        parser: MessageParser,
+        data: bytes,
+        event_type: ButtonEventType,
+        source: str,
+    ) -> None:
+        messages = parser.feed(data)
+
+        assert len(messages) == 1
+        msg = messages[0]
+        assert isinstance(msg, ButtonEventMessage)
+        assert msg.event_type == event_type
+        assert msg.source == source
+        assert msg.button == 5
+
+    def test_parse_kes_message(self, parser):
         messages = parser.feed(b"KES, [01:04:10], enabled\r\n")
         assert messages[0].enabled is True
 
@@ -111,16 +140,14 @@ class TestMessageParser:
         messages = parser.feed(b"KES, [01:04:10], disabled\r\n")
         assert messages[0].enabled is False
 
-    def test_parse_gss_message(self):
-        parser = MessageParser()
+    def test_parse_gss_message(self, parser):
         data = b"GSS, [01:05:01], 3\r\n"
         messages = parser.feed(data)
 
         assert isinstance(messages[0], GrafikEyeSceneMessage)
         assert messages[0].scene == 3
 
-    def test_parse_svs_message(self):
-        parser = MessageParser()
+    def test_parse_svs_message(self, parser):
         data = b"SVS, [01:06:01], R, MOVING\r\n"
         messages = parser.feed(data)
 
@@ -128,30 +155,26 @@ class TestMessageParser:
         assert messages[0].command == "R"
         assert messages[0].status == "MOVING"
 
-    def test_parse_unknown_message(self):
-        parser = MessageParser()
+    def test_parse_unknown_message(self, parser):
         data = b"UNKNOWN, some, data, here\r\n"
         messages = parser.feed(data)
 
         assert isinstance(messages[0], UnknownMessage)
         assert messages[0].parts == ("UNKNOWN", "some", "data", "here")
 
-    def test_ignored_messages(self):
-        parser = MessageParser()
-        ignored = [
+    @pytest.mark.parametrize(
+        "data",
+        [
             b"Keypad button monitoring enabled\r\n",
             b"Dimmer level monitoring enabled\r\n",
             b"Keypad led monitoring enabled\r\n",
-        ]
-        for msg in ignored:
-            parser.reset()
-            messages = parser.feed(msg)
-            assert len(messages) == 0
+        ],
+    )
+    def test_ignored_messages(self, parser: MessageParser, data: bytes) -> None:
+        assert parser.feed(data) == []
 
-    def test_buffered_parsing(self):
+    def test_buffered_parsing(self, parser):
         """Test that partial messages are buffered correctly."""
-        parser = MessageParser()
-
         messages = parser.feed(b"KLS, [02:06:03], 0000000")
         assert len(messages) == 0
 
@@ -159,8 +182,7 @@ class TestMessageParser:
         assert len(messages) == 1
         assert isinstance(messages[0], KLSMessage)
 
-    def test_multiple_messages_in_one_chunk(self):
-        parser = MessageParser()
+    def test_multiple_messages_in_one_chunk(self, parser):
         data = b"KLS, [02:06:03], 000000000000000000000000\r\nDL, [01:01:00:02:04], 50\r\n"
         messages = parser.feed(data)
 
@@ -168,10 +190,8 @@ class TestMessageParser:
         assert isinstance(messages[0], KLSMessage)
         assert isinstance(messages[1], DimmerLevelMessage)
 
-    def test_combined_partial_frames(self):
+    def test_combined_partial_frames(self, parser):
         """Test handling of fragmented RS232 data."""
-        parser = MessageParser()
-
         parser.feed(b"KLS, [02:06")
         parser.feed(b":03], 000000")
         messages = parser.feed(b"000222112110000000\r\nDL, [01:")
@@ -181,6 +201,25 @@ class TestMessageParser:
         assert len(messages) == 1
         assert messages[0].level == 75
 
+    def test_feed_iter_closed_early_keeps_remaining_lines(self, parser):
+        """Lines after the last yielded message stay buffered."""
+        messages = parser.feed_iter(SAMPLE1_BYTES + _DL_FRAME)
+        assert isinstance(next(messages), KLSMessage)
+        messages.close()
+
+        remaining = parser.feed(b"")
+        assert len(remaining) == 1
+        assert isinstance(remaining[0], DimmerLevelMessage)
+
+    def test_feed_after_unfinished_feed_iter_skips_yielded_lines(self, parser):
+        """A suspended iterator's yielded lines are not parsed again."""
+        messages = parser.feed_iter(_DL_FRAME)
+        assert next(messages).address == "[01:01:00:02:04]"
+
+        later = parser.feed(b"DL, [01:01:00:02:05], 10\r\n")
+        assert [msg.address for msg in later] == ["[01:01:00:02:05]"]
+        assert list(messages) == []
+
 
 class TestKLSButtonWindow:
     """Tests for KLS button window extraction.
@@ -189,55 +228,39 @@ class TestKLSButtonWindow:
     Button N (1-8) is at index 9 + (N-1).
     """
 
-    def test_button_6_sample_1_is_off(self):
+    def test_button_6_sample_1_is_off(self, parser):
         """KLS, [02:06:03], 000000000222112110000000 -> button 6 = OFF"""
-        parser = MessageParser()
-        data = b"KLS, [02:06:03], 000000000222112110000000\r\n"
-        msg = parser.feed(data)[0]
+        data = SAMPLE1_BYTES
+        msg = next(parser.feed_iter(data))
 
         # Button 6: index = 9 + 5 = 14, digit = 2 = OFF
         assert msg.get_cco_relay_state(6) is False
 
-    def test_button_6_sample_2_is_on(self):
+    def test_button_6_sample_2_is_on(self, parser):
         """KLS, [02:06:03], 000000000222111110000000 -> button 6 = ON"""
-        parser = MessageParser()
-        data = b"KLS, [02:06:03], 000000000222111110000000\r\n"
-        msg = parser.feed(data)[0]
+        data = SAMPLE2_BYTES
+        msg = next(parser.feed_iter(data))
 
         # Button 6: index = 9 + 5 = 14, digit = 1 = ON
         assert msg.get_cco_relay_state(6) is True
 
-    def test_all_8_buttons_sample_1(self):
-        """Verify all 8 button states in sample 1."""
-        parser = MessageParser()
-        data = b"KLS, [02:06:03], 000000000222112110000000\r\n"
-        msg = parser.feed(data)[0]
-
-        # Window: 22211211
-        expected = {1: False, 2: False, 3: False, 4: True,
-                    5: True, 6: False, 7: True, 8: True}
-
-        for button, expected_state in expected.items():
-            assert msg.get_cco_relay_state(button) == expected_state, \
-                f"Button {button}: expected {expected_state}"
-
-    def test_all_8_buttons_sample_2(self):
-        """Verify all 8 button states in sample 2."""
-        parser = MessageParser()
-        data = b"KLS, [02:06:03], 000000000222111110000000\r\n"
-        msg = parser.feed(data)[0]
-
-        # Window: 22211111
-        expected = {1: False, 2: False, 3: False, 4: True,
-                    5: True, 6: True, 7: True, 8: True}
-
-        for button, expected_state in expected.items():
-            assert msg.get_cco_relay_state(button) == expected_state
-
-    def test_button_out_of_range(self):
-        parser = MessageParser()
+    @pytest.mark.parametrize(
+        ("data", "button", "expected"),
+        [
+            *((SAMPLE1_BYTES, button, state) for button, state in _SAMPLE1_EXPECTED),
+            *((SAMPLE2_BYTES, button, state) for button, state in _SAMPLE2_EXPECTED),
+        ],
+    )
+    def test_all_8_buttons(
+        self, parser: MessageParser, data: bytes, button: int, expected: bool
+    ) -> None:
+        """Verify each button state in both sample windows."""
+        msg = next(parser.feed_iter(data))
+        assert msg.get_cco_relay_state(button) is expected
+
+    def test_button_out_of_range(self, parser):
         data = b"KLS, [02:06:03], 000000000111111110000000\r\n"
-        msg = parser.feed(data)[0]
+        msg = next(parser.feed_iter(data))
 
         assert msg.get_cco_relay_state(0) is False
         assert msg.get_cco_relay_state(9) is False
@@ -246,37 +269,55 @@ class TestKLSButtonWindow:
 class TestCommandBuilders:
     """Tests for command builder functions."""
 
-    def test_fade_dim(self):
-        cmd = commands.fade_dim("[01:01:00:02:04]", 75.0, 2.0, 0.5)
-        assert cmd == "FADEDIM, 75.0, 2.0, 0.5, [01:01:00:02:04]"
-
-    def test_fade_dim_defaults(self):
-        cmd = commands.fade_dim("[01:01:00:02:04]", 100.0)
-        assert cmd == "FADEDIM, 100.0, 0.0, 0.0, [01:01:00:02:04]"
-
-    def test_cco_close(self):
-        cmd = commands.cco_close("[02:06:03]", 1)
-        assert cmd == "CCOCLOSE, [02:06:03], 1"
-
-    def test_cco_open(self):
-        cmd = commands.cco_open("[02:06:03]", 1)
-        assert cmd == "CCOOPEN, [02:06:03], 1"
-
-    def test_cco_pulse(self):
-        cmd = commands.cco_pulse("[02:06:03]", 1, 2.5)
-        assert cmd == "CCOPULSE, [02:06:03], 1, 5"
-
-    def test_keypad_commands(self):
-        assert commands.keypad_button_press("[01:04:10]", 3) == "KBP, [01:04:10], 3"
-        assert commands.keypad_button_release("[01:04:10]", 3) == "KBR, [01:04:10], 3"
-        assert commands.request_keypad_led_states("[02:06:03]") == "RKLS, [02:06:03]"
-
-    def test_monitoring_commands(self):
-        assert commands.enable_dimmer_monitoring() == "DLMON"
-        assert commands.disable_dimmer_monitoring() == "DLMOFF"
-        assert commands.enable_keypad_button_monitoring() == "KBMON"
-        assert commands.enable_keypad_led_monitoring() == "KLMON"
-
-    def test_system_commands(self):
-        assert commands.prompt_off() == "PROMPTOFF"
-        assert commands.prompt_on() == "PROMPTON"
+    @pytest.mark.parametrize(
+        ("builder", "args", "expected"),
+        [
+            pytest.param(
+                commands.fade_dim,
+                ("[01:01:00:02:04]", 75.0, 2.0, 0.5),
+                b"FADEDIM, 75.0, 2.0, 0.5, [01:01:00:02:04]",
+                id="fade_dim",
+            ),
+            pytest.param(
+                commands.fade_dim,
+                ("[01:01:00:02:04]", 100.0),
+                b"FADEDIM, 100.0, 0.0, 0.0, [01:01:00:02:04]",
+                id="fade_dim_defaults",
+            ),
+            pytest.param(
+                commands.cco_close, ("[02:06:03]", 1), b"CCOCLOSE, [02:06:03], 1",
+                id="cco_close",
+            ),
+            pytest.param(
+                commands.cco_open, ("[02:06:03]", 1), b"CCOOPEN, [02:06:03], 1",
+                id="cco_open",
+            ),
+            pytest.param(
+                commands.cco_pulse, ("[02:06:03]", 1, 2.5), b"CCOPULSE, [02:06:03], 1, 5",
+                id="cco_pulse",
+            ),
+            pytest.param(
+                commands.keypad_button_press, ("[01:04:10]", 3), b"KBP, [01:04:10], 3",
+                id="keypad_button_press",
+            ),
+            pytest.param(
+                commands.keypad_button_release, ("[01:04:10]", 3), b"KBR, [01:04:10], 3",
+                id="keypad_button_release",
+            ),
+            pytest.param(
+                commands.request_keypad_led_states, ("[02:06:03]",), b"RKLS, [02:06:03]",
+                id="request_keypad_led_states",
+            ),
+            pytest.param(commands.enable_dimmer_monitoring, (), b"DLMON", id="dlmon"),
+            pytest.param(commands.disable_dimmer_monitoring, (), b"DLMOFF", id="dlmoff"),
+            pytest.param(commands.enable_keypad_button_monitoring, (), b"KBMON", id="kbmon"),
+            pytest.param(commands.enable_keypad_led_monitoring, (), b"KLMON", id="klmon"),
+            pytest.param(commands.prompt_off, (), b"PROMPTOFF", id="prompt_off"),
+            pytest.param(commands.prompt_on, (), b"PROMPTON", id="prompt_on"),
+        ],
+    )
+    def test_command_builder(
+        self, builder: Callable[..., str], args: tuple, expected: bytes
+    ) -> None:
+        """Builders produce the exact ASCII line written to the controller."""
+        assert builder(*args).encode("ascii") == expected